@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Answering-stage benchmark against the in-process FakeBackend.
+Drives GeminiClient.process_questions over a synthetic question set at each
+concurrency setting and reports questions/sec, per-question latency
+percentiles (including retries and backoff) and retry counts, without
+network access or API quota.
+
+Usage:
+    python benchmarks/bench_answering.py [--concurrency 1 2 4 8 16] [--questions 200]
+    python benchmarks/bench_answering.py --rate-limit-rate 0.1 --error-rate 0.02 --output report.json
+    python benchmarks/bench_answering.py --connection-error-rate 0.2   # transport failures must be retried
+    python benchmarks/bench_answering.py --check   # resume must recover every answer after a crash mid-line
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Every run starts cold and without progress bars
+os.environ.pop('ANSWER_CACHE_PATH', None)
+os.environ.setdefault('TQDM_DISABLE', '1')
+
+from gemini_client import GeminiClient, is_answered, load_checkpoint  # noqa: E402
+from llm_backend import FakeBackend  # noqa: E402
+from question_model import Question  # noqa: E402
+from resilience import CircuitBreaker, RetryPolicy  # noqa: E402
+from token_usage import UsageLedger  # noqa: E402
+
+DEFAULT_CONCURRENCY = [1, 2, 4, 8, 16]
+
+
+def build_questions(count: int) -> List[Question]:
+    """A paper-shaped mix: ten MCQs, then short and long answers, repeated."""
+    questions = []
+    for idx in range(count):
+        position = idx % 20
+        if position < 10:
+            questions.append(Question(
+                'Group-A', position + 1, 'MCQ', f"Which statement about topic {idx} is correct?",
+                ('(a) first', '(b) second', '(c) third', '(d) none of these')
+            ))
+        elif position < 15:
+            questions.append(Question('Group-B', position - 9, 'Short Answer', f"Explain concept {idx} briefly."))
+        else:
+            questions.append(Question('Group-C', position - 14, 'Long Answer', f"Discuss design {idx} in detail."))
+    return questions
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list."""
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_case(questions: List[Question], concurrency: int, args) -> Dict:
+    backend = FakeBackend(
+        args.latency_ms, args.latency_sigma, args.rate_limit_rate, args.error_rate,
+        retry_after=args.retry_after, seed=args.seed, connection_error_rate=args.connection_error_rate
+    )
+    # An in-memory ledger keeps benchmark tokens out of the real usage log and daily budget
+    ledger = UsageLedger()
+    client = GeminiClient(
+        'bench',
+        max_concurrency=concurrency,
+        requests_per_minute=args.requests_per_minute,
+        tokens_per_minute=0,
+        batch_size=args.batch_size,
+        retry_policy=RetryPolicy(args.max_retries, args.retry_base_delay, args.retry_max_delay),
+        # A fresh breaker per case so one run's failures do not pause the next
+        circuit_breaker=CircuitBreaker(args.breaker_threshold, args.breaker_reset),
+        backend=backend,
+        usage_ledger=ledger
+    )
+
+    latencies: List[float] = []
+    answer_request = client._answer_request
+
+    def timed_request(request: List[Question], account=None):
+        start = time.perf_counter()
+        results = answer_request(request, account)
+        latencies.extend([time.perf_counter() - start] * len(request))
+        return results
+    client._answer_request = timed_request
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        results = client.process_questions(questions, checkpoint_path=os.path.join(tmp, 'answers.jsonl'))
+        elapsed = time.perf_counter() - start
+
+    return {
+        'concurrency': concurrency,
+        'questions': len(results),
+        'failed': sum(not is_answered(result) for result in results),
+        'seconds': round(elapsed, 3),
+        'questions_per_sec': round(len(results) / elapsed, 2) if elapsed else None,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 1),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 1),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 1),
+        'retries': client.retries,
+        'backend_calls': backend.calls,
+        'backend_errors': backend.errors,
+        'tokens': ledger.day_totals()['prompt_tokens'] + ledger.day_totals()['response_tokens']
+    }
+
+
+def check_resume(questions: List[Question]) -> bool:
+    """Cut a checkpoint off in the middle of a line, resume, and make sure every answer is readable again."""
+    client = GeminiClient(
+        'bench', requests_per_minute=0, tokens_per_minute=0, batch_size=1,
+        backend=FakeBackend(0, 0, 0, 0), usage_ledger=UsageLedger()
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'answers.jsonl')
+        client.process_questions(questions, checkpoint_path=path)
+        with open(path, 'rb') as f:
+            lines = f.readlines()
+        kept = len(lines) // 2
+        # A crash while writing leaves half a line behind
+        with open(path, 'wb') as f:
+            f.writelines(lines[:kept])
+            f.write(lines[kept][:len(lines[kept]) // 2])
+        calls = client.backend.calls
+        results = client.process_questions(questions, checkpoint_path=path, resume=True)
+        resent = client.backend.calls - calls
+        recovered = load_checkpoint(path)
+
+    ok = True
+    if sorted(recovered) != list(range(len(questions))):
+        ok = False
+        print(f"LOST     resume: {len(questions) - len(recovered)} of {len(questions)} answers unreadable in the checkpoint")
+    if resent != len(questions) - kept or not all(is_answered(result) for result in results):
+        ok = False
+        print(f"RESENT   resume: {resent} requests for {len(questions) - kept} missing answers")
+    if ok:
+        print(f"OK       resume: {len(questions) - kept} answers recovered after a cut line")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the answering stage against a fake LLM backend')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=DEFAULT_CONCURRENCY, help='max_concurrency settings to run')
+    parser.add_argument('--questions', type=int, default=200, help='Questions answered per run')
+    parser.add_argument('--batch-size', type=int, default=1, help='MCQs per batched request')
+    parser.add_argument('--latency-ms', type=float, default=800, help='Median backend latency')
+    parser.add_argument('--latency-sigma', type=float, default=0.5, help='Log-normal spread of latency (0 = constant)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.05, help='Probability of a 429 per call')
+    parser.add_argument('--error-rate', type=float, default=0.01, help='Probability of a 500 per call')
+    parser.add_argument('--connection-error-rate', type=float, default=0.01, help='Probability of a dropped connection per call')
+    parser.add_argument('--retry-after', type=float, help='Retry-after hint attached to 429s, in seconds')
+    parser.add_argument('--requests-per-minute', type=float, default=0, help='Client rate limit (0 = off)')
+    parser.add_argument('--max-retries', type=int, default=5)
+    parser.add_argument('--retry-base-delay', type=float, default=0.2)
+    parser.add_argument('--retry-max-delay', type=float, default=5)
+    parser.add_argument('--breaker-threshold', type=int, default=5)
+    parser.add_argument('--breaker-reset', type=float, default=2)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', help='Write the JSON report to this file')
+    parser.add_argument('--check', action='store_true', help='Only check that resume recovers a cut checkpoint')
+    args = parser.parse_args()
+
+    # Retry warnings for every injected error would drown the table
+    logging.getLogger('gemini_client').setLevel(logging.ERROR)
+    logging.getLogger('resilience').setLevel(logging.ERROR)
+
+    questions = build_questions(args.questions)
+    if args.check:
+        sys.exit(0 if check_resume(questions) else 1)
+
+    results = []
+    for concurrency in args.concurrency:
+        result = run_case(questions, max(1, concurrency), args)
+        results.append(result)
+        print(
+            f"concurrency {result['concurrency']:3d} {result['seconds']:8.2f}s {result['questions_per_sec'] or 0:8.2f} q/s "
+            f"p50 {result['p50_ms']:8.1f}ms p95 {result['p95_ms']:8.1f}ms p99 {result['p99_ms']:8.1f}ms "
+            f"{result['retries']:4d} retries {result['failed']:3d} failed"
+        )
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'settings': {key: value for key, value in vars(args).items() if key not in ('concurrency', 'output')}
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+End-to-end extraction benchmark over the synthetic paper corpus.
+Runs PDFExtractor per strategy on text-layer and rasterised papers, reports
+pages/sec, questions/sec and peak RSS, and writes a JSON report that can be
+diffed between releases. The same corpus doubles as a parse stability check
+against golden_parse.json, next to a check that sparse scanned pages still
+reach OCR.
+
+Usage:
+    python benchmarks/bench_extraction.py [--pages 1 3 12 60 300] [--output report.json]
+    python benchmarks/bench_extraction.py --check           # compare parse results with golden, check blank-page skipping
+    python benchmarks/bench_extraction.py --update-golden   # accept current parse results
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import platform
+import resource
+import multiprocessing
+from datetime import datetime
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+# Benchmarks measure cold extraction, so keep the cache and OCR pool out of the way
+os.environ.pop('EXTRACTION_CACHE_DIR', None)
+os.environ.pop('OCR_POOL_SIZE', None)
+
+import fitz  # noqa: E402
+from corpus import build_corpus, build_sparse_page, DEFAULT_PAGE_COUNTS  # noqa: E402
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), 'golden_parse.json')
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(__file__), '.corpus')
+
+# Scanned pages with almost nothing on them that must not be mistaken for blank ones
+SPARSE_PAGES = {
+    'one question line at 10pt': ("7. Explain routing with a suitable example. [ 5 ]", 10),
+    'one question line at 12pt': ("7. Explain routing with a suitable example. [ 5 ]", 12),
+    'END OF PAPER trailer': ("END OF PAPER", 10),
+}
+
+# Strategy name -> document variants it applies to
+CASES = {
+    'extract_questions': ('text', 'scanned'),
+    'extract_questions_parallel_ocr': ('scanned',),
+    'extract_questions_ocr_pool': ('scanned',),
+    'iter_questions': ('text', 'scanned'),
+    'parse_only': ('text',),
+}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_case(case: str, entry: Dict, workers: int) -> Dict:
+    """Run one strategy on one document; executed in a fresh process so peak RSS is per case."""
+    from pdf_extractor import PDFExtractor
+    from ocr_pool import OCRWorkerPool
+
+    pool = None
+    if case == 'extract_questions_ocr_pool':
+        pool = OCRWorkerPool(workers)
+    extractor = PDFExtractor(
+        entry['path'],
+        ocr_workers=workers if case == 'extract_questions_parallel_ocr' else 1,
+        ocr_pool=pool
+    )
+
+    text = None
+    if case == 'parse_only':
+        # Extraction happens outside the timed region so only the parser is measured
+        with fitz.open(entry['path']) as doc:
+            text = extractor._join_pages(extractor._extract_pages(doc))
+
+    start = time.perf_counter()
+    if case == 'iter_questions':
+        questions = list(extractor.iter_questions())
+    elif case == 'parse_only':
+        questions = extractor._parse_text_for_questions(text)
+    else:
+        questions = extractor.extract_questions()
+    elapsed = time.perf_counter() - start
+
+    if pool is not None:
+        pool.close()
+
+    return {
+        'case': case,
+        'document': entry['name'],
+        'variant': entry['variant'],
+        'pages': entry['pages'],
+        'seconds': round(elapsed, 4),
+        'pages_per_sec': round(entry['pages'] / elapsed, 2) if elapsed else None,
+        'questions': len(questions),
+        'questions_per_sec': round(len(questions) / elapsed, 2) if elapsed else None,
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'stages': extractor.timings['stages']
+    }
+
+
+def _parse_digest(entry: Dict, streamed: bool = False) -> Dict:
+    """Digest of the parsed questions for one document, used for the stability check."""
+    from pdf_extractor import PDFExtractor
+    extractor = PDFExtractor(entry['path'], ocr_workers=1)
+    questions = list(extractor.iter_questions()) if streamed else extractor.extract_questions()
+    payload = json.dumps(questions, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return {'questions': len(questions), 'sha256': hashlib.sha256(payload).hexdigest()}
+
+
+def run_benchmarks(entries: List[Dict], workers: int) -> List[Dict]:
+    ctx = multiprocessing.get_context('spawn')
+    results = []
+    for entry in entries:
+        for case, variants in CASES.items():
+            if entry['variant'] not in variants:
+                continue
+            with ctx.Pool(1) as pool:
+                result = pool.apply(_run_case, (case, entry, workers))
+            results.append(result)
+            print(
+                f"{case:32s} {entry['name']:28s} {result['seconds']:9.3f}s "
+                f"{result['pages_per_sec'] or 0:9.2f} pages/s {result['questions_per_sec'] or 0:10.2f} q/s "
+                f"{result['peak_rss_mb']:8.1f} MB"
+            )
+    return results
+
+
+def check_golden(entries: List[Dict], update: bool) -> bool:
+    """Compare parse digests of text-layer documents with the golden file."""
+    # Rasterised papers depend on the installed Tesseract build, so only text papers are pinned
+    digests = {entry['name']: _parse_digest(entry) for entry in entries if entry['variant'] == 'text'}
+
+    if update:
+        with open(GOLDEN_PATH, 'w', encoding='utf-8') as f:
+            json.dump(digests, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Updated {GOLDEN_PATH} with {len(digests)} documents")
+        return True
+
+    with open(GOLDEN_PATH, 'r', encoding='utf-8') as f:
+        golden = json.load(f)
+
+    # The corpus papers fit one streaming buffer, so iter_questions must parse them identically
+    streamed = {entry['name']: _parse_digest(entry, streamed=True) for entry in entries if entry['variant'] == 'text'}
+
+    stable = True
+    for name, digest in digests.items():
+        expected = golden.get(name)
+        if streamed[name] != digest:
+            stable = False
+            print(f"DIVERGED {name}: iter_questions {streamed[name]['questions']} vs extract_questions {digest['questions']} questions")
+        if expected is None:
+            print(f"NEW      {name}: {digest['questions']} questions (not in golden file)")
+        elif expected != digest:
+            stable = False
+            print(f"CHANGED  {name}: {expected['questions']} -> {digest['questions']} questions")
+        else:
+            print(f"OK       {name}: {digest['questions']} questions")
+    return stable
+
+
+def check_sparse_pages() -> bool:
+    """Render each sparse page the way OCR does and make sure it is not skipped as blank."""
+    from pdf_extractor import DEFAULT_OCR_DPI, _content_pixels, _render_page_for_ocr
+
+    sent = True
+    for label, (line, fontsize) in SPARSE_PAGES.items():
+        doc = build_sparse_page(line, fontsize)
+        _, skip_reason = _content_pixels(_render_page_for_ocr(doc[0], DEFAULT_OCR_DPI))
+        doc.close()
+        if skip_reason is not None:
+            sent = False
+            print(f"SKIPPED  {label}: treated as blank ({skip_reason})")
+        else:
+            print(f"OK       {label}: sent to OCR")
+    return sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark PDF question extraction')
+    parser.add_argument('--pages', type=int, nargs='+', default=DEFAULT_PAGE_COUNTS, help='Page counts to generate')
+    parser.add_argument('--corpus-dir', default=DEFAULT_CORPUS_DIR, help='Where generated PDFs are kept')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='Workers for parallel OCR cases')
+    parser.add_argument('--output', help='Write the JSON report to this file')
+    parser.add_argument('--check', action='store_true', help='Only check parse stability against the golden file')
+    parser.add_argument('--update-golden', action='store_true', help='Rewrite the golden file from current results')
+    args = parser.parse_args()
+
+    has_tesseract = shutil.which('tesseract') is not None
+    entries = build_corpus(args.corpus_dir, args.pages, rasterise=has_tesseract)
+    if not has_tesseract:
+        print("tesseract not found, skipping rasterised papers")
+
+    if args.check or args.update_golden:
+        stable = check_golden(entries, args.update_golden)
+        sent = check_sparse_pages() if args.check else True
+        sys.exit(0 if stable and sent else 1)
+
+    results = run_benchmarks(entries, args.workers)
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'pymupdf': fitz.VersionBind,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'workers': args.workers,
+            'tesseract': has_tesseract
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Synthetic MAKAUT-style question paper corpus for extraction benchmarks.
+Papers are generated with PyMuPDF, either with a text layer or rasterised to
+image-only pages, so the same content exercises both extraction paths.
+"""
+
+import os
+import random
+from typing import Dict, List
+
+import fitz  # PyMuPDF
+
+# Page counts covered by the default corpus
+DEFAULT_PAGE_COUNTS = [1, 3, 12, 60, 300]
+
+_TOPICS = [
+    "routing", "congestion control", "the OSI model", "sliding window flow control",
+    "CSMA/CD", "subnetting", "DNS resolution", "TCP handshakes", "error detection",
+    "IPv6 addressing", "the data link layer", "public key cryptography"
+]
+
+_HEADER = [
+    "MAULANA ABUL KALAM AZAD UNIVERSITY OF TECHNOLOGY, WEST BENGAL",
+    "Paper Code : PCC-CS602 Computer Networks UPID : 006521",
+    "Time Allotted : 3 Hours Full Marks : 70",
+    "The Figures in the margin indicate full marks.",
+    "Candidate are required to give their answers in their own words as far as practicable",
+]
+
+
+def _group_a_page(rng: random.Random) -> List[str]:
+    lines = _HEADER + ["", "Group-A (Very Short Answer Type Question)",
+                       "1. Answer any ten of the following : [ 1 x 10 = 10 ]"]
+    for number in range(1, 13):
+        topic = rng.choice(_TOPICS)
+        lines.append(f"({number}) Which of the following statements about {topic} is correct?")
+        lines.append(f"(a) option one on {topic} (b) option two (c) option three (d) none of these")
+    return lines
+
+
+def _group_b_page(rng: random.Random) -> List[str]:
+    lines = ["Group-B (Short Answer Type Question)",
+             "Answer any three of the following : [ 5 x 3 = 15 ]"]
+    for number in range(2, 7):
+        lines.append(f"{number}. Explain {rng.choice(_TOPICS)} with a suitable example.")
+    return lines
+
+
+def _group_c_page(rng: random.Random) -> List[str]:
+    lines = ["Group-C (Long Answer Type Question)",
+             "Answer any three of the following : [ 15 x 3 = 45 ]"]
+    for number in range(7, 12):
+        first, second = rng.sample(_TOPICS, 2)
+        lines.append(f"{number}. (a) Describe {first} in detail. (b) Compare it with {second}. [ 7 + 8 ]")
+    lines.append("END OF PAPER")
+    return lines
+
+
+def _page_lines(page_index: int, rng: random.Random) -> List[str]:
+    """Pages cycle Group-A, Group-B, Group-C, so longer documents are compiled banks of papers."""
+    return [_group_a_page, _group_b_page, _group_c_page][page_index % 3](rng)
+
+
+def rasterise_pdf(doc: fitz.Document, dpi: int = 150) -> fitz.Document:
+    """Replace every page with an image of itself so there is no text layer left."""
+    scanned = fitz.open()
+    for page in doc:
+        pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+        new_page = scanned.new_page(width=page.rect.width, height=page.rect.height)
+        new_page.insert_image(new_page.rect, pixmap=pix)
+    doc.close()
+    return scanned
+
+
+def build_sparse_page(line: str, fontsize: float, dpi: int = 150) -> fitz.Document:
+    """A scanned A4 page carrying a single line of text, like a question spilling onto its own sheet."""
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    page.insert_text((48, 120), line, fontsize=fontsize, fontname="helv")
+    return rasterise_pdf(doc, dpi)
+
+
+def build_paper_pdf(path: str, pages: int, rasterise: bool = False, seed: int = 0, dpi: int = 150) -> str:
+    """Write a synthetic paper with the given page count and return its path."""
+    rng = random.Random(seed)
+    doc = fitz.open()
+    for page_index in range(pages):
+        page = doc.new_page(width=595, height=842)  # A4 in points
+        page.insert_textbox(
+            fitz.Rect(48, 48, 547, 794),
+            "\n".join(_page_lines(page_index, rng)),
+            fontsize=9,
+            fontname="helv"
+        )
+
+    if rasterise:
+        doc = rasterise_pdf(doc, dpi)
+
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+    return path
+
+
+def build_corpus(directory: str, page_counts: List[int] = None, rasterise: bool = True) -> List[Dict]:
+    """Generate the corpus into directory and return one entry per document."""
+    os.makedirs(directory, exist_ok=True)
+    entries = []
+    for pages in page_counts or DEFAULT_PAGE_COUNTS:
+        variants = ['text', 'scanned'] if rasterise else ['text']
+        for variant in variants:
+            name = f"paper_{pages:03d}p_{variant}.pdf"
+            path = os.path.join(directory, name)
+            if not os.path.exists(path):
+                build_paper_pdf(path, pages, rasterise=(variant == 'scanned'), seed=pages)
+            entries.append({'name': name, 'path': path, 'pages': pages, 'variant': variant})
+    return entries
@@ -0,0 +1,147 @@
+"""
+Persistent cache of generated answers.
+Answers are stored in SQLite keyed by a hash of the normalised question text,
+its options, the prompt version and the model, so questions that recur across
+years of papers are answered from disk instead of the API.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_SPACE_RE = re.compile(r'\s+')
+# Leading numbering such as "1.", "(ii)" or "Q.3" differs between papers for the same question
+_NUMBERING_RE = re.compile(r'^(?:q\.?\s*)?\(?(?:\d{1,2}|[ivx]{1,5}|[a-d])\s*[.)]\s*', re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+)
+"""
+
+
+def normalise_text(text: str) -> str:
+    """Lowercase, collapse whitespace and drop leading numbering."""
+    text = _SPACE_RE.sub(' ', text).strip().lower()
+    return _NUMBERING_RE.sub('', text)
+
+
+def make_answer_key(text: str, options: Iterable[str], prompt_version: str, model: str) -> str:
+    """Hash a question and everything that shapes its answer into a cache key."""
+    parts = [prompt_version, model, normalise_text(text)]
+    parts.extend(normalise_text(option) for option in options)
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+class AnswerCache:
+    """
+    SQLite-backed answer cache with a TTL and a cap on the number of entries.
+    One connection is shared by all threads of a client; WAL mode lets several
+    processes use the same database file.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: Optional[float] = None, max_entries: int = 100000):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL sync stays consistent on crashes and keeps hits (which touch last_used_at) cheap
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached answer, or None when missing or older than the TTL."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT answer, created_at FROM answers WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE answers SET last_used_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, answer: str) -> None:
+        """Store an answer and evict the least recently used entries beyond max_entries."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers (key, answer, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+                (key, answer, now, now)
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM answers WHERE key IN (SELECT key FROM answers ORDER BY last_used_at LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+                logger.debug(f"Evicted {count - self.max_entries} answers from cache")
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete every entry older than the TTL. Returns the number removed."""
+        if not self.ttl_seconds:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM answers WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'size_bytes': os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[AnswerCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_answer_cache() -> Optional[AnswerCache]:
+    """Return the process-wide cache configured via ANSWER_CACHE_PATH, if any."""
+    global _default_cache
+    db_path = os.getenv('ANSWER_CACHE_PATH')
+    if not db_path:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.db_path != db_path:
+            ttl_days = float(os.getenv('ANSWER_CACHE_TTL_DAYS', '180'))
+            max_entries = int(os.getenv('ANSWER_CACHE_MAX_ENTRIES', '100000'))
+            _default_cache = AnswerCache(db_path, ttl_days * 86400 if ttl_days > 0 else None, max_entries)
+        return _default_cache
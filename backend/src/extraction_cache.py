@@ -0,0 +1,175 @@
+"""
+Content-addressed cache for PDF extraction results.
+Entries are keyed by the SHA-256 of the PDF bytes, the extractor version and
+the settings that affect extraction, and hold the raw per-page text together
+with the parsed question list, the section markers that matched and the
+layout rows, so a hit restores everything a fresh extraction reports.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def hash_pdf(pdf_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a PDF file."""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    On-disk extraction cache with size-bounded LRU eviction.
+    Recency is tracked through file modification times, so the cache
+    survives restarts and can be shared by several worker processes.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 512):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(pdf_hash: str, version: str, settings: Optional[Dict] = None) -> str:
+        """
+        Build the cache key for a PDF hash and extractor version. Settings that change
+        the extracted text (OCR resolution, blank-page skipping, ...) are folded into
+        the key, so changing them is a cache miss instead of returning stale text.
+        """
+        if not settings:
+            return f"{pdf_hash}-v{version}"
+        settings_hash = hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        return f"{pdf_hash}-v{version}-{settings_hash}"
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached entry ({'pages', 'questions', 'section_markers', 'layout_lines'}) or None."""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            # Touch the entry so eviction treats it as recently used
+            os.utime(path, None)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        pages: List[Dict],
+        questions: List[Dict],
+        section_markers: Optional[Dict] = None,
+        layout_lines: Optional[List] = None
+    ) -> None:
+        """Store an extraction result and evict old entries if over budget."""
+        entry = {
+            'pages': pages,
+            'questions': questions,
+            'section_markers': section_markers or {},
+            'layout_lines': [list(line) for line in layout_lines or []]
+        }
+        # Write to a temp file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits its size budget."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for item in it:
+                if not item.name.endswith('.json'):
+                    continue
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            logger.debug(f"Evicted extraction cache entry {os.path.basename(path)}")
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current cache size."""
+        entries = 0
+        size = 0
+        with os.scandir(self.cache_dir) as it:
+            for item in it:
+                if item.name.endswith('.json'):
+                    entries += 1
+                    size += item.stat().st_size
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'size_bytes': size
+        }
+
+
+_default_cache: Optional[ExtractionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[ExtractionCache]:
+    """Return the process-wide cache configured via EXTRACTION_CACHE_DIR, if any."""
+    global _default_cache
+    cache_dir = os.getenv('EXTRACTION_CACHE_DIR')
+    if not cache_dir:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.cache_dir != cache_dir:
+            max_size_mb = int(os.getenv('EXTRACTION_CACHE_MAX_MB', '512'))
+            _default_cache = ExtractionCache(cache_dir, max_size_mb)
+        return _default_cache
@@ -1,27 +1,340 @@
 import os
+import re
 import json
+import time
 import logging
-from typing import Dict, List, Optional, Any
-import google.generativeai as genai  # type: ignore
-from tqdm import tqdm
-from dotenv import load_dotenv
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Any, Union
+
+from answer_cache import AnswerCache, get_default_answer_cache, make_answer_key
+from llm_backend import GeminiBackend, LLMBackend, LLMResponse
+from question_model import Question, QuestionBatch
+from rate_limiter import RateLimiter
+from resilience import CircuitBreaker, RetryPolicy, call_with_retry, get_default_breaker
+from token_usage import PaperAccount, UsageLedger, get_default_ledger
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+MODEL_NAME = 'gemini-1.5-flash'
+
+# Bump whenever ANSWER_PROMPT changes so cached answers from the old prompt are not reused
+PROMPT_VERSION = "1"
+
+ANSWER_PROMPT = """Please provide a detailed answer to the following question. 
+Format your response with clear sections and bullet points where appropriate.
+If the question has multiple parts, address each part separately.
+
+Question:
+{question}
+
+Answer:"""
+
+# Bump whenever BATCH_PROMPT changes; batched answers are cached separately from single ones
+BATCH_PROMPT_VERSION = "1"
+
+# Question types packed into one request in batched mode; longer answers stay one request each
+BATCHABLE_TYPES = ('MCQ',)
+
+BATCH_PROMPT = """Answer each of the following multiple-choice questions. For every question give the correct option followed by a one or two sentence explanation.
+
+Respond with JSON only, no other text, in exactly this form:
+{{"answers": [{{"id": <question id>, "answer": "<correct option and explanation>"}}]}}
+
+Include one entry for every question id below.
+
+{questions}"""
+
+# Used for long answers when the full prompt no longer fits the token budget
+CONCISE_ANSWER_PROMPT = """Answer the following question concisely, in at most 150 words.
+
+Question:
+{question}
+
+Answer:"""
+
+# Response cap for answers trimmed to CONCISE_ANSWER_PROMPT
+TRIMMED_RESPONSE_TOKENS = 250
+
+# Order in which question types are sent when a budget is set: cheap MCQs first
+_TYPE_PRIORITY = {'MCQ': 0, 'Short Answer': 1}
+
+
+def answer_priority(question: Question) -> int:
+    """Sort key sending cheap question types first, so a token budget covers as many questions as it can."""
+    return _TYPE_PRIORITY.get(question.type, 2)
+
+BUDGET_EXHAUSTED_ANSWER = "Skipped: token budget exhausted"
+
+_JSON_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.IGNORECASE)
+
+# Answers that mean the question still has to be asked again on resume
+_FAILED_ANSWER_PREFIXES = ("Error processing question", "No response generated", BUDGET_EXHAUSTED_ANSWER)
+
+# Tokens reserved for the response when a request is admitted; corrected from usage metadata afterwards
+RESPONSE_TOKEN_ESTIMATE = 800
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt token count (about four characters per token for English text)."""
+    return max(1, len(text) // 4)
+
+
+def parse_batch_answers(text: str, expected_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Validate a batched JSON response and return {id: answer} for the entries
+    that are well formed. Unknown ids, duplicates and empty answers are dropped
+    so those questions can be asked again on their own.
+    """
+    expected = set(expected_ids)
+    try:
+        payload = json.loads(_JSON_FENCE_RE.sub('', text or ''))
+    except ValueError:
+        return {}
+    entries = payload.get('answers') if isinstance(payload, dict) else payload
+    if not isinstance(entries, list):
+        return {}
+    
+    answers: Dict[int, str] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        answer_id, answer = entry.get('id'), entry.get('answer')
+        if isinstance(answer_id, str) and answer_id.strip().isdigit():
+            answer_id = int(answer_id)
+        if not isinstance(answer_id, int) or answer_id not in expected or answer_id in answers:
+            continue
+        if not isinstance(answer, str) or not answer.strip():
+            continue
+        answers[answer_id] = answer.strip()
+    return answers
+
+
+_env_lock = threading.Lock()
+_env_loaded = False
+
+
+def _load_env() -> None:
+    """Load .env into the environment once per process."""
+    global _env_loaded
+    with _env_lock:
+        if not _env_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _env_loaded = True
+
+
+def is_answered(result: Dict[str, str]) -> bool:
+    """Whether a result holds a real answer rather than an error placeholder."""
+    return not result.get('answer', '').startswith(_FAILED_ANSWER_PREFIXES)
+
+
+def load_checkpoint(path: str) -> Dict[int, Dict[str, str]]:
+    """
+    Read the answers recorded in a JSONL checkpoint, keyed by question index.
+    Failed answers and a line cut short by a crash are ignored; later lines win.
+    """
+    answered: Dict[int, Dict[str, str]] = {}
+    if not os.path.exists(path):
+        return answered
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                index = entry['index']
+                result = {"question": entry['question'], "answer": entry['answer']}
+            except (ValueError, KeyError, TypeError):
+                continue
+            if not isinstance(index, int) or index < 0:
+                continue
+            if is_answered(result):
+                answered[index] = result
+            else:
+                answered.pop(index, None)
+    return answered
+
+
+def _drop_partial_line(path: str) -> None:
+    """Cut a line left unfinished by a crash off the end of a checkpoint, so appends start on a fresh line."""
+    try:
+        f = open(path, 'rb+')
+    except FileNotFoundError:
+        return
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        keep = end
+        # Walk back in blocks to the last newline; a complete file ends with one
+        while keep > 0:
+            start = max(0, keep - 4096)
+            f.seek(start)
+            block = f.read(keep - start)
+            newline = block.rfind(b'\n')
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            keep = start
+        if keep < end:
+            f.truncate(keep)
+
+
+def _question_label(question: Question) -> str:
+    return f"{question.group} Q{question.question_number}".strip()
+
+
+class AnswerRun:
+    """
+    Answering of one paper, fed questions as they become available. Each add()
+    plans its questions into requests (consecutive MCQs batched, MCQs first under
+    a budget) and sends them up to the client's max_concurrency at once; every
+    answer is appended to the JSONL checkpoint as its request completes. With
+    resume, questions already answered in the checkpoint are filled in without a request.
+    """
+
+    def __init__(
+        self,
+        client: 'GeminiClient',
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        pdf_path: Optional[str] = None,
+        on_progress: Optional[Callable[[int], None]] = None
+    ):
+        self.client = client
+        self.account = client.open_account(pdf_path)
+        # output/<pdf>_answers.jsonl unless the caller keeps checkpoints elsewhere
+        self.checkpoint_path = checkpoint_path or os.path.join('output', f"{self.account.paper}_answers.jsonl")
+        self.questions: List[Question] = []
+        self.results: List[Optional[Dict[str, str]]] = []
+        self.resumed = 0
+        self._on_progress = on_progress
+        self._previous = load_checkpoint(self.checkpoint_path) if resume else {}
+        os.makedirs(os.path.dirname(self.checkpoint_path) or '.', exist_ok=True)
+        if resume:
+            _drop_partial_line(self.checkpoint_path)
+        self._checkpoint = open(self.checkpoint_path, 'a' if resume else 'w', encoding='utf-8')
+        self._executor = ThreadPoolExecutor(max_workers=client.max_concurrency, thread_name_prefix='gemini')
+        self._futures: Dict[Future, List[int]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Requests sent and not yet collected."""
+        return len(self._futures)
+
+    def add(self, questions: Iterable[Question]) -> List[int]:
+        """Queue the next questions of the paper, returning the indices that need a request."""
+        start = len(self.questions)
+        self.questions.extend(questions)
+        pending = []
+        for idx in range(start, len(self.questions)):
+            previous = self._previous.pop(idx, None)
+            if previous is not None and previous['question'] == self.questions[idx].prompt_text():
+                self.results.append(previous)
+                self.resumed += 1
+            else:
+                self.results.append(None)
+                pending.append(idx)
+        requests = self.client._plan_requests(self.questions, pending)
+        if self.account.limited:
+            # A stable sort keeps paper order within each type
+            requests.sort(key=lambda request: answer_priority(self.questions[request[0]]))
+        for request in requests:
+            future = self._executor.submit(
+                self.client._answer_request, [self.questions[idx] for idx in request], self.account
+            )
+            self._futures[future] = request
+        return pending
+
+    def collect(self, max_in_flight: int = 0) -> None:
+        """Checkpoint finished requests until at most max_in_flight are outstanding."""
+        while len(self._futures) > max_in_flight:
+            done, _ = wait(self._futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                request = self._futures.pop(future)
+                for idx, result in zip(request, future.result()):
+                    self.results[idx] = result
+                    self._checkpoint.write(json.dumps({"index": idx, **result}, ensure_ascii=False) + '\n')
+                # Flushed per request so a crash loses at most the requests still in flight
+                self._checkpoint.flush()
+                if self._on_progress is not None:
+                    self._on_progress(len(request))
+
+    def close(self) -> List[Dict[str, str]]:
+        """Wait for every request and return the results in question order."""
+        try:
+            self.collect()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._checkpoint.close()
+        return self.results
+
+
 class GeminiClient:
-    def __init__(self, pdf_path: str):
-        """Initialize Gemini client with API key from environment."""
+    def __init__(
+        self,
+        pdf_path: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        answer_cache: Optional[AnswerCache] = None,
+        batch_size: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        question_deadline: Optional[float] = None,
+        backend: Optional[LLMBackend] = None,
+        usage_ledger: Optional[UsageLedger] = None,
+        paper_token_budget: Optional[int] = None
+    ):
+        """
+        Initialize Gemini client with API key from environment. The SDK and model are
+        set up on the first request and shared with every other client in the process.
+        Passing a backend (e.g. llm_backend.FakeBackend) replaces the Gemini API.
+        """
         self.pdf_path = pdf_path
-        load_dotenv()
-        api_key = os.getenv('GEMINI_API_KEY')
-        logger.debug(f"Loaded GEMINI_API_KEY: {'set' if api_key else 'NOT SET'}")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        genai.configure(api_key=api_key, transport="rest")
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
-        
+        _load_env()
+        # Requests in flight at once while answering a paper; 1 answers questions one after another
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('GEMINI_MAX_CONCURRENCY', '4'))
+        self.max_concurrency = max(1, max_concurrency)
+        # Quota shared by all requests of this client; 0 disables a limit
+        if requests_per_minute is None:
+            requests_per_minute = float(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '60'))
+        if tokens_per_minute is None:
+            tokens_per_minute = float(os.getenv('GEMINI_TOKENS_PER_MINUTE', '1000000'))
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        # Falls back to the cache configured through ANSWER_CACHE_PATH
+        self.answer_cache = answer_cache if answer_cache is not None else get_default_answer_cache()
+        # Consecutive MCQs packed into one request; 1 sends every question on its own
+        if batch_size is None:
+            batch_size = int(os.getenv('GEMINI_BATCH_SIZE', '1'))
+        self.batch_size = max(1, batch_size)
+        # Transient errors are retried with backoff; the breaker is shared by every client in the process
+        if retry_policy is None:
+            retry_policy = RetryPolicy(
+                int(os.getenv('GEMINI_MAX_RETRIES', '5')),
+                float(os.getenv('GEMINI_RETRY_BASE_DELAY', '1')),
+                float(os.getenv('GEMINI_RETRY_MAX_DELAY', '60'))
+            )
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else get_default_breaker()
+        # Seconds one question may spend waiting and retrying before it is reported as failed; 0 disables
+        if question_deadline is None:
+            question_deadline = float(os.getenv('GEMINI_QUESTION_DEADLINE', '300'))
+        self.question_deadline = question_deadline
+        self.retries = 0
+        self._retries_lock = threading.Lock()
+        # Token usage per question, paper and day; the ledger also holds the daily budget
+        self.usage_ledger = usage_ledger if usage_ledger is not None else get_default_ledger()
+        if paper_token_budget is None:
+            paper_token_budget = int(os.getenv('GEMINI_PAPER_TOKEN_BUDGET', '0'))
+        self.paper_token_budget = paper_token_budget
+        if backend is None:
+            api_key = os.getenv('GEMINI_API_KEY')
+            logger.debug(f"Loaded GEMINI_API_KEY: {'set' if api_key else 'NOT SET'}")
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            backend = GeminiBackend(api_key, MODEL_NAME)
+        self.backend = backend
+
     def analyze_question(self, question: str, max_retries: int = 3) -> str:
         """Analyze a single question using Gemini API."""
         prompt = f"""Please analyze and answer the following question in a clear and concise manner:
@@ -30,75 +343,321 @@ class GeminiClient:
 
 Provide a well-structured response that directly addresses the question."""
 
-        for attempt in range(max_retries):
-            try:
-                response = self.model.generate_content(prompt)
-                return response.text or "No response generated"
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    error_msg = f"Error analyzing question: {str(e)}"
-                    logger.error(f"Failed to analyze question after {max_retries} attempts: {e}")
-                    return error_msg
-                logger.warning(f"Attempt {attempt + 1} failed, retrying...")
-                continue
-        
-        return "Failed to analyze question after all retries"  # Fallback return
+        try:
+            response = self._generate(prompt, deadline=self._deadline(), max_attempts=max_retries)
+            return response.text or "No response generated"
+        except Exception as e:
+            logger.error(f"Failed to analyze question: {e}")
+            return f"Error analyzing question: {str(e)}"
 
-    def process_questions(self, questions: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """Process questions with Gemini and return answers."""
-        logger.info(f"Processing {len(questions)} questions with Gemini")
-        results = []
+    def process_questions(
+        self,
+        questions: Union[QuestionBatch, Iterable[Dict]],
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        json_path: Optional[str] = None,
+        pdf_path: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Process questions with Gemini and return answers in question order.
+        Each answer is appended to a JSONL checkpoint (output/<pdf>_answers.jsonl by
+        default) as soon as it arrives; with resume, questions already answered there
+        are skipped. The pretty JSON file is written only when json_path is given.
+        pdf_path names the paper when a shared client answers several.
+        Under a token budget MCQs are sent first, answers are trimmed when the full
+        prompt no longer fits, and questions left once it runs out are skipped.
+        """
+        from tqdm import tqdm
         
-        # Process each question with progress bar
-        for idx, question in enumerate(tqdm(questions, desc="Analyzing questions")):
+        # Dicts without a question number are numbered by position
+        questions = list(QuestionBatch.coerce(questions))
+        retries_before = self.retries
+        with tqdm(desc="Analyzing questions") as progress:
+            run = self.open_run(checkpoint_path, resume, pdf_path, progress.update)
             try:
-                # Use index as fallback for number
-                number = question.get('number', f"Q{idx+1}")
-                group = question.get('group', '')
-                text = question.get('text', '')
-                options = question.get('options', [])
-                options_str = ''
-                if options:
-                    options_str = '\nOptions:\n' + '\n'.join(options)
-                formatted_question = f"{group}\nQuestion {number}:\n{text}{options_str}"
-                
-                # Get answer from Gemini
-                response = self.model.generate_content(
-                    f"""Please provide a detailed answer to the following question. 
-                    Format your response with clear sections and bullet points where appropriate.
-                    If the question has multiple parts, address each part separately.
-                    
-                    Question:
-                    {formatted_question}
-                    
-                    Answer:"""
+                pending = run.add(questions)
+                progress.reset(total=len(pending))
+                logger.info(
+                    f"Processing {len(pending)} questions with Gemini"
+                    + (f" ({run.resumed} already answered in {run.checkpoint_path})" if run.resumed else "")
                 )
-                
-                # Format the result with question and answer on separate lines
-                result = {
-                    "question": formatted_question,
-                    "answer": response.text.strip() if hasattr(response, 'text') and response.text else "No response generated"
-                }
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error processing question: {str(e)}")
-                results.append({
-                    "question": formatted_question if 'formatted_question' in locals() else str(question),
-                    "answer": f"Error processing question: {str(e)}"
-                })
+            finally:
+                results = run.close()
         
-        # Save results to JSON with pretty formatting
-        if results:
-            output_file = os.path.join('output', f"{os.path.splitext(os.path.basename(self.pdf_path))[0]}_answers.json")
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
-            logger.info(f"Saved {len(results)} results to {output_file}")
+        if json_path and results:
+            self.save_results(results, json_path)
         
+        if self.answer_cache is not None:
+            logger.info(f"Answer cache: {self.answer_cache.stats()}")
+        if self.retries > retries_before:
+            logger.info(f"Retried {self.retries - retries_before} Gemini requests")
+        self.log_usage(run.account)
         return results
 
+    def _paper_name(self, pdf_path: Optional[str] = None) -> str:
+        return os.path.splitext(os.path.basename(pdf_path or self.pdf_path or 'questions'))[0]
+
+    def open_account(self, pdf_path: Optional[str] = None) -> PaperAccount:
+        """
+        Start the usage account of one paper under this client's budgets. Pass it to
+        every answer_question/answer_batch call for the paper so the budget applies.
+        """
+        return PaperAccount(self._paper_name(pdf_path), self.usage_ledger, self.paper_token_budget)
+
+    def open_run(
+        self,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        pdf_path: Optional[str] = None,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> AnswerRun:
+        """Start answering one paper; add questions to the run as they become available, then close it."""
+        return AnswerRun(self, checkpoint_path, resume, pdf_path, on_progress)
+
+    def log_usage(self, account: PaperAccount) -> None:
+        """Log the token usage and cost of a finished paper, warning about questions the budget skipped."""
+        usage = account.summary()
+        logger.info(
+            f"Token usage for {usage['paper']}: {usage['prompt_tokens']} prompt + {usage['response_tokens']} response "
+            f"tokens (${usage['cost_usd']:.4f}) over {usage['questions']} questions"
+        )
+        if usage['skipped']:
+            logger.warning(f"Token budget exhausted, {usage['skipped']} questions of {usage['paper']} left unanswered")
+
+    def _plan_requests(self, questions: List[Question], indices: Iterable[int]) -> List[List[int]]:
+        """Group consecutive batchable questions into requests of up to batch_size, keeping order."""
+        requests: List[List[int]] = []
+        for idx in indices:
+            last = requests[-1] if requests else None
+            if (
+                self.batch_size > 1 and questions[idx].type in BATCHABLE_TYPES and last
+                and questions[last[0]].type in BATCHABLE_TYPES and len(last) < self.batch_size
+            ):
+                last.append(idx)
+            else:
+                requests.append([idx])
+        return requests
+
+    def _answer_request(self, questions: List[Question], account: Optional[PaperAccount] = None) -> List[Dict[str, str]]:
+        # The question deadline starts once, here, and covers the batch, its fallbacks and every wait
+        deadline = self._deadline()
+        if len(questions) == 1:
+            return [self.answer_question(questions[0], account, deadline)]
+        return self.answer_batch(questions, account, deadline)
+
+    def answer_batch(
+        self,
+        questions: List[Question],
+        account: Optional[PaperAccount] = None,
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Answer several MCQs with one JSON-structured request. Questions missing
+        from the response or with malformed entries fall back to single requests,
+        which share the batch's deadline (the question deadline from now if not given).
+        """
+        if deadline is None:
+            deadline = self._deadline()
+        if account is None:
+            account = self.open_account()
+        results: List[Optional[Dict[str, str]]] = [None] * len(questions)
+        cache_keys: List[Optional[str]] = [None] * len(questions)
+        pending = []
+        for idx, question in enumerate(questions):
+            if self.answer_cache is not None:
+                cache_keys[idx] = make_answer_key(
+                    question.text, question.options, f"{PROMPT_VERSION}-batch{BATCH_PROMPT_VERSION}", MODEL_NAME
+                )
+                cached = self._cache_get(cache_keys[idx])
+                if cached is not None:
+                    results[idx] = {"question": question.prompt_text(), "answer": cached}
+                    continue
+            pending.append(idx)
+        
+        if len(pending) > 1:
+            prompt = BATCH_PROMPT.format(questions="\n\n".join(
+                f"[id {idx}]\n{questions[idx].prompt_text()}" for idx in pending
+            ))
+            # Batched answers are short, so reserve a fraction of the single-answer estimate each
+            response_tokens = RESPONSE_TOKEN_ESTIMATE // 4 * len(pending)
+            reserved = estimate_tokens(prompt) + response_tokens
+            answers = {}
+            if account.reserve(reserved, wait=True):
+                try:
+                    response = self._generate(prompt, response_tokens, deadline)
+                    # The whole response is charged before parsing, so questions it failed to cover still cost
+                    self._record_batch(
+                        account, [questions[idx] for idx in pending],
+                        response.prompt_tokens or estimate_tokens(prompt),
+                        response.response_tokens or estimate_tokens(response.text)
+                    )
+                    answers = parse_batch_answers(response.text, pending)
+                except Exception as e:
+                    logger.warning(f"Batched request for {len(pending)} questions failed, answering them singly: {e}")
+                finally:
+                    account.release(reserved)
+            if len(answers) < len(pending):
+                logger.info(f"Batched response covered {len(answers)} of {len(pending)} questions, answering the rest singly")
+            for idx, answer in answers.items():
+                results[idx] = {"question": questions[idx].prompt_text(), "answer": answer}
+                if cache_keys[idx] is not None:
+                    self._cache_put(cache_keys[idx], answer)
+        
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = self.answer_question(questions[idx], account, deadline)
+        return results
+
+    def _record_batch(
+        self, account: PaperAccount, questions: List[Question], prompt_tokens: int, response_tokens: int
+    ) -> None:
+        """Split a batched request's usage over its questions; the first ones take the remainder so the totals add up."""
+        prompt_share, prompt_rest = divmod(prompt_tokens, len(questions))
+        response_share, response_rest = divmod(response_tokens, len(questions))
+        for position, question in enumerate(questions):
+            account.record(
+                _question_label(question),
+                prompt_share + (position < prompt_rest),
+                response_share + (position < response_rest)
+            )
+
+    def answer_question(
+        self,
+        question: Question,
+        account: Optional[PaperAccount] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, str]:
+        """
+        Answer one question, returning {'question', 'answer'}; errors are reported in the answer.
+        Waiting and retries stop at the deadline, the question deadline from now if not given.
+        """
+        if deadline is None:
+            deadline = self._deadline()
+        formatted_question = question.prompt_text()
+        cache_key = None
+        if self.answer_cache is not None:
+            cache_key = make_answer_key(question.text, question.options, PROMPT_VERSION, MODEL_NAME)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return {"question": formatted_question, "answer": cached}
+        if account is None:
+            account = self.open_account()
+        
+        prompt = ANSWER_PROMPT.format(question=formatted_question)
+        response_tokens, max_output_tokens = RESPONSE_TOKEN_ESTIMATE, None
+        reserved = estimate_tokens(prompt) + response_tokens
+        # Waiting lets in-flight requests settle, so only recorded usage rules a question out
+        if not account.reserve(reserved, wait=True):
+            # Trim to a concise prompt with a capped response before giving up on the question
+            prompt = CONCISE_ANSWER_PROMPT.format(question=formatted_question)
+            response_tokens = max_output_tokens = TRIMMED_RESPONSE_TOKENS
+            reserved = estimate_tokens(prompt) + response_tokens
+            if not account.reserve(reserved, wait=True):
+                account.skip()
+                return {"question": formatted_question, "answer": BUDGET_EXHAUSTED_ANSWER}
+            # Trimmed answers are not cached under the full prompt's key
+            cache_key = None
+        try:
+            # Get answer from Gemini
+            response = self._generate(prompt, response_tokens, deadline, max_output_tokens=max_output_tokens)
+            account.record(
+                _question_label(question),
+                response.prompt_tokens or estimate_tokens(prompt),
+                response.response_tokens or estimate_tokens(response.text)
+            )
+            
+            # Format the result with question and answer on separate lines
+            answer = response.text.strip() or None
+            if answer and cache_key is not None:
+                self._cache_put(cache_key, answer)
+            return {
+                "question": formatted_question,
+                "answer": answer or "No response generated"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error processing question: {str(e)}")
+            return {
+                "question": formatted_question,
+                "answer": f"Error processing question: {str(e)}"
+            }
+        finally:
+            account.release(reserved)
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        try:
+            return self.answer_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Answer cache lookup failed: {e}")
+            return None
+
+    def _cache_put(self, key: str, answer: str) -> None:
+        try:
+            self.answer_cache.put(key, answer)
+        except Exception as e:
+            logger.warning(f"Failed to store answer in cache: {e}")
+
+    def _deadline(self) -> Optional[float]:
+        return time.monotonic() + self.question_deadline if self.question_deadline > 0 else None
+
+    def _on_retry(self, attempt: int, delay: float, error: BaseException) -> None:
+        with self._retries_lock:
+            self.retries += 1
+        logger.warning(f"Gemini request failed ({error}), retry {attempt} in {delay:.1f}s")
+
+    def _generate(
+        self,
+        prompt: str,
+        response_tokens: int = RESPONSE_TOKEN_ESTIMATE,
+        deadline: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        max_output_tokens: Optional[int] = None
+    ) -> LLMResponse:
+        """Send one prompt to the model, retrying transient failures until the deadline."""
+        policy = self.retry_policy
+        if max_attempts is not None:
+            policy = RetryPolicy(max_attempts, policy.base_delay, policy.max_delay)
+        return call_with_retry(
+            lambda: self._send(prompt, response_tokens, max_output_tokens, deadline),
+            policy, self.circuit_breaker, deadline, self._on_retry
+        )
+
+    def _send(
+        self,
+        prompt: str,
+        response_tokens: int,
+        max_output_tokens: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> LLMResponse:
+        """Send one prompt to the model once the rate limiter admits it before the deadline."""
+        estimated = estimate_tokens(prompt) + response_tokens
+        waited = self.rate_limiter.acquire(estimated, deadline)
+        if waited > 0.5:
+            logger.debug(f"Rate limiter held request for {waited:.1f}s")
+        response = self.backend.generate(prompt, max_output_tokens)
+        if response.total_tokens:
+            self.rate_limiter.settle(estimated, response.total_tokens)
+        return response
+
     def save_results(self, results: List[Dict[str, str]], output_path: str) -> None:
         """Save results to a JSON file."""
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
-        logger.info(f"Saved {len(results)} results to {output_path}") 
\ No newline at end of file
+        logger.info(f"Saved {len(results)} results to {output_path}")
+
+
+_default_client: Optional[GeminiClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> GeminiClient:
+    """
+    Return the process-wide client, created on first use. It is safe to share
+    across threads, and its rate limiter then meters the one API quota for all of them.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = GeminiClient()
+        return _default_client
+
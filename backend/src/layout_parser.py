@@ -0,0 +1,159 @@
+"""
+Layout-aware Group-A MCQ parsing for text-layer PDFs.
+Uses the block/line/span geometry from PyMuPDF's page.get_text("dict") to
+tell question numbers and (a)-(d) options apart by their position on the
+page, instead of re-deriving structure from whitespace-collapsed text.
+"""
+
+import re
+import logging
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lines whose vertical centres are this close (in points) form one visual row
+ROW_TOLERANCE = 3.0
+# Question numbers must start within this distance of the first question's left edge
+COLUMN_TOLERANCE = 15.0
+# Group-A usually asks for "any ten"; matches the cap used by the text strategies
+MAX_GROUP_A_QUESTIONS = 10
+
+_GROUP_A_RE = re.compile(r'group\s*-?\s*a\b', re.IGNORECASE)
+_GROUP_B_RE = re.compile(r'group\s*-?\s*b\b', re.IGNORECASE)
+
+# "1.", "(1)", "1)", "Q.1", "(i)", "ii)" at the start of a row
+_QUESTION_MARKER_RE = re.compile(r'^(?:Q\.?\s*)?\(?(\d{1,2}|[ivxl]{1,6})\s*[.)]\s*(?=\S)', re.IGNORECASE)
+
+# "(a)" or "a)" anywhere on a row, or "a." at the start of one
+_OPTION_MARKER_RE = re.compile(r'(?:(?<=\s)|^)(?:\(([a-d])\)|([a-d])\)|^([a-d])\.(?=\s))\s*', re.IGNORECASE)
+
+# Group-level instructions that are numbered like a question
+_INSTRUCTION_RE = re.compile(
+    r'answer any|choose the correct alternative|\d+\s*x\s*\d+\s*=',
+    re.IGNORECASE
+)
+
+
+class LayoutLine(NamedTuple):
+    """One visual row of text on a page with its bounding box."""
+    page: int
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    text: str
+
+
+def iter_layout_lines(page, page_number: int) -> Iterator[LayoutLine]:
+    """Yield the page's text rows top to bottom, merging lines that share a baseline."""
+    data = page.get_text("dict")
+    lines = []
+    for block in data.get('blocks', []):
+        if block.get('type', 0) != 0:  # Skip image blocks
+            continue
+        for line in block.get('lines', []):
+            text = ''.join(span['text'] for span in line.get('spans', [])).strip()
+            if text:
+                x0, y0, x1, y1 = line['bbox']
+                lines.append(LayoutLine(page_number, x0, y0, x1, y1, text))
+
+    # Options printed in columns come out as separate lines on the same row
+    lines.sort(key=lambda l: ((l.y0 + l.y1) / 2, l.x0))
+    row: List[LayoutLine] = []
+    for line in lines:
+        if row and abs((line.y0 + line.y1) / 2 - (row[0].y0 + row[0].y1) / 2) > ROW_TOLERANCE:
+            yield _merge_row(row)
+            row = []
+        row.append(line)
+    if row:
+        yield _merge_row(row)
+
+
+def _merge_row(row: List[LayoutLine]) -> LayoutLine:
+    row = sorted(row, key=lambda l: l.x0)
+    return LayoutLine(
+        row[0].page,
+        row[0].x0,
+        min(l.y0 for l in row),
+        max(l.x1 for l in row),
+        max(l.y1 for l in row),
+        ' '.join(l.text for l in row)
+    )
+
+
+def _split_options(text: str) -> Tuple[str, List[str]]:
+    """Split a row into the text before the first option marker and the options on it."""
+    markers = list(_OPTION_MARKER_RE.finditer(text))
+    if not markers:
+        return text, []
+    options = []
+    for idx, marker in enumerate(markers):
+        end = markers[idx + 1].start() if idx + 1 < len(markers) else len(text)
+        letter = next(group for group in marker.groups() if group).lower()
+        body = text[marker.end():end].strip()
+        options.append(f"({letter}) {body}")
+    return text[:markers[0].start()].strip(), options
+
+
+def parse_group_a_layout(lines: Iterable[LayoutLine], max_questions: int = MAX_GROUP_A_QUESTIONS) -> List[Dict]:
+    """
+    Parse Group-A MCQs from page rows. Returns an empty list when no Group-A
+    marker or no positioned question numbers are found, so callers can fall
+    back to the text strategies.
+    """
+    questions: List[Dict] = []
+    current: Optional[Dict] = None
+    question_x: Optional[float] = None
+    in_group = False
+
+    def finish(question: Optional[Dict]) -> None:
+        if question is None:
+            return
+        text = ' '.join(' '.join(question['text']).split())
+        if text and len(questions) < max_questions:
+            questions.append({
+                'group': 'Group-A',
+                'question_number': len(questions) + 1,
+                'type': 'MCQ',
+                'text': text,
+                'options': question['options']
+            })
+
+    for line in lines:
+        if not in_group:
+            in_group = bool(_GROUP_A_RE.search(line.text))
+            continue
+        if _GROUP_B_RE.search(line.text):
+            break
+
+        marker = _QUESTION_MARKER_RE.match(line.text)
+        if marker and _INSTRUCTION_RE.search(line.text):
+            continue
+        # Only numbers in the question column start a question; numbered text inside options does not
+        if marker and (question_x is None or abs(line.x0 - question_x) <= COLUMN_TOLERANCE):
+            if question_x is None:
+                question_x = line.x0
+            finish(current)
+            if len(questions) >= max_questions:
+                current = None
+                break
+            text, options = _split_options(line.text[marker.end():])
+            current = {'text': [text], 'options': options}
+            continue
+
+        if current is None:
+            continue
+        text, options = _split_options(line.text)
+        if options:
+            if text and not current['options']:
+                current['text'].append(text)
+            current['options'].extend(options)
+        elif current['options']:
+            # A wrapped option continues on the next row
+            current['options'][-1] = f"{current['options'][-1]} {line.text}"
+        else:
+            current['text'].append(line.text)
+
+    finish(current)
+    logger.debug(f"Layout parser found {len(questions)} Group-A questions")
+    return questions
@@ -0,0 +1,151 @@
+"""
+Backends that turn one prompt into generated text for GeminiClient.
+GeminiBackend calls the Gemini API; FakeBackend answers in-process with a
+configurable latency distribution, 429/500 and connection error rates and
+token counts, so
+the answering stage can be load-tested without network access or quota.
+"""
+
+import re
+import json
+import math
+import time
+import random
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+_sdk_lock = threading.Lock()
+_model = None
+_model_key = None
+
+# Question ids in a batched prompt, see gemini_client.BATCH_PROMPT
+_BATCH_ID_RE = re.compile(r'^\[id (\d+)\]$', re.MULTILINE)
+
+
+def get_model(api_key: str, model_name: str):
+    """Return the process-wide GenerativeModel, configuring the SDK on first use."""
+    global _model, _model_key
+    with _sdk_lock:
+        if _model is None or _model_key != (api_key, model_name):
+            # Imported here so importing the client (e.g. at webhook startup) does not load the SDK
+            import google.generativeai as genai  # type: ignore
+            genai.configure(api_key=api_key, transport="rest")
+            _model = genai.GenerativeModel(model_name)
+            _model_key = (api_key, model_name)
+        return _model
+
+
+@dataclass(slots=True)
+class LLMResponse:
+    """Generated text and the token usage reported for it (0 when unknown)."""
+    text: str
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.response_tokens
+
+
+class LLMBackend(ABC):
+    """
+    Sends one prompt and returns an LLMResponse; failures are raised as exceptions.
+    max_output_tokens caps the length of the response when given.
+    """
+
+    @abstractmethod
+    def generate(self, prompt: str, max_output_tokens: Optional[int] = None) -> LLMResponse:
+        """Generate a response to prompt."""
+
+
+class GeminiBackend(LLMBackend):
+    """The Gemini API through the shared google.generativeai model."""
+
+    def __init__(self, api_key: str, model_name: str):
+        self.api_key = api_key
+        self.model_name = model_name
+
+    def generate(self, prompt: str, max_output_tokens: Optional[int] = None) -> LLMResponse:
+        generation_config = {'max_output_tokens': max_output_tokens} if max_output_tokens else None
+        response = get_model(self.api_key, self.model_name).generate_content(prompt, generation_config=generation_config)
+        try:
+            text = response.text or ''
+        except ValueError:
+            # Raised by the SDK when the candidate was blocked and has no text parts
+            text = ''
+        usage = getattr(response, 'usage_metadata', None)
+        return LLMResponse(
+            text,
+            getattr(usage, 'prompt_token_count', 0) or 0,
+            getattr(usage, 'candidates_token_count', 0) or 0
+        )
+
+
+class FakeAPIError(Exception):
+    """Error raised by FakeBackend, carrying an HTTP status like the SDK's API errors."""
+
+    def __init__(self, code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"{code} {message}")
+        self.code = code
+        self.retry_after = retry_after
+
+
+class FakeBackend(LLMBackend):
+    """
+    In-process stand-in for the API. Latency is log-normal around latency_ms
+    (latency_sigma 0 makes it constant); rate_limit_rate, error_rate and
+    connection_error_rate are the probabilities of a 429, a 500 and a dropped
+    connection as raised by the REST transport. Batched prompts get a valid JSON answer.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        latency_sigma: float = 0.5,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        response_tokens: int = 300,
+        seed: Optional[int] = None,
+        connection_error_rate: float = 0.0
+    ):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.connection_error_rate = connection_error_rate
+        self.retry_after = retry_after
+        self.response_tokens = response_tokens
+        self.calls = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, max_output_tokens: Optional[int] = None) -> LLMResponse:
+        with self._lock:
+            self.calls += 1
+            latency = self.latency_ms / 1000 * math.exp(self._rng.gauss(0, self.latency_sigma))
+            roll = self._rng.random()
+        if roll < self.rate_limit_rate + self.error_rate + self.connection_error_rate:
+            with self._lock:
+                self.errors += 1
+            # Rejections come back faster than generated answers
+            time.sleep(latency / 10)
+            if roll < self.rate_limit_rate:
+                raise FakeAPIError(429, "Resource has been exhausted", self.retry_after)
+            if roll < self.rate_limit_rate + self.error_rate:
+                raise FakeAPIError(500, "Internal error")
+            import requests
+            raise requests.exceptions.ConnectionError("Connection aborted: remote end closed connection without response")
+        time.sleep(latency)
+
+        ids = _BATCH_ID_RE.findall(prompt)
+        if ids:
+            text = json.dumps({"answers": [{"id": int(i), "answer": f"(a) Fake answer {i}"} for i in ids]})
+            response_tokens = self.response_tokens // 4 * len(ids)
+        else:
+            response_tokens = min(self.response_tokens, max_output_tokens or self.response_tokens)
+            text = "Fake answer. " * max(1, response_tokens // 3)
+        return LLMResponse(text.strip(), max(1, len(prompt) // 4), response_tokens)
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 import os
+import json
+import time
+import queue
 import argparse
 import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 import sys
 try:
     from dotenv import load_dotenv
@@ -13,6 +18,7 @@ except ImportError:
 
 from pdf_extractor import PDFExtractor
 from gemini_client import GeminiClient
+from question_model import Question, QuestionBatch
 
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("pdf_extractor").setLevel(logging.DEBUG)
@@ -38,53 +44,337 @@ def process_pdf(
     pdf_path: str,
     api_key: Optional[str] = None,
     temp_dir: Optional[Path] = None,
-    output_dir: Optional[Path] = None
-) -> None:
-    """Process a PDF file through the entire pipeline."""
+    output_dir: Optional[Path] = None,
+    spill: bool = False,
+    resume: bool = False
+) -> List[Dict]:
+    """
+    Process a PDF file through the entire pipeline. Questions are handed to the
+    answering stage in memory; with spill they go through a JSONL file in temp_dir
+    instead, which keeps the options structured and frees the extractor first.
+    With resume, questions answered by an earlier interrupted run are not asked again.
+    """
     # Setup directories
-    temp_dir, output_dir = setup_directories()
+    default_temp_dir, default_output_dir = setup_directories()
+    temp_dir = temp_dir or default_temp_dir
+    output_dir = output_dir or default_output_dir
     
     # Generate output paths
     pdf_name = Path(pdf_path).stem
-    temp_csv = temp_dir / f"{pdf_name}_questions.csv"
+    spill_path = temp_dir / f"{pdf_name}_questions.jsonl"
     output_json = output_dir / f"{pdf_name}_answers.json"
+    checkpoint = output_dir / f"{pdf_name}_answers.jsonl"
     
     try:
         # Step 1: Extract questions from PDF
         logger.info(f"Starting extraction from {pdf_path}")
         with PDFExtractor(pdf_path) as extractor:
-            extractor.extract_to_csv(str(temp_csv))
+            if spill:
+                extractor.extract_to_jsonl(str(spill_path))
+            else:
+                questions = extractor.extract_question_batch()
+        if spill:
+            questions = QuestionBatch.read_jsonl(str(spill_path))
+        
+        if not len(questions):
+            raise ValueError("No questions extracted from PDF")
         
         # Step 2: Process questions with Gemini
         logger.info("Initializing Gemini client")
         client = GeminiClient(pdf_path)
         
-        # Read questions from CSV
-        import pandas as pd
-        df = pd.read_csv(temp_csv)
-        questions = df['question'].tolist()
-        
         # Step 3: Get answers from Gemini
         logger.info("Processing questions with Gemini")
-        results = client.process_questions(questions)
+        results = client.process_questions(questions, checkpoint_path=str(checkpoint), resume=resume)
         
         # Step 4: Save results
         logger.info("Saving results")
         client.save_results(results, str(output_json))
         
         logger.info(f"Pipeline completed successfully. Results saved to {output_json}")
+        return results
         
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
         raise
     finally:
         # Cleanup temporary files
-        if temp_csv.exists():
-            temp_csv.unlink()
+        if spill_path.exists():
+            spill_path.unlink()
+
+def collect_pdfs(source: str) -> List[str]:
+    """List the PDFs of a batch: every PDF under a directory, or the paths in a list file (one per line)."""
+    if os.path.isdir(source):
+        return sorted(str(path) for path in Path(source).rglob('*') if path.suffix.lower() == '.pdf')
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f]
+    # Relative entries are resolved against the list file so it can travel with the archive
+    return [os.path.join(base, line) for line in lines if line and not line.startswith('#')]
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Dict]:
+    """Read the latest status of every file recorded in a batch manifest."""
+    statuses = {}
+    if not manifest_path.exists():
+        return statuses
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A run killed mid-write can leave a truncated last line
+                continue
+            statuses[entry['path']] = entry
+    return statuses
+
+
+def _file_signature(pdf_path: str) -> Dict:
+    stat = os.stat(pdf_path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def _init_batch_worker() -> None:
+    """Run OCR serially in each batch worker, so workers x OCR pool processes cannot oversubscribe the CPUs."""
+    os.environ['OCR_POOL_SIZE'] = '0'
+    os.environ['OCR_WORKERS'] = '1'
+
+
+def _extract_for_batch(pdf_path: str) -> Dict:
+    """Extract one PDF inside a batch worker process."""
+    start = time.perf_counter()
+    # Parallelism comes from the batch pool, so each file is OCR'd serially in its worker
+    extractor = PDFExtractor(pdf_path, ocr_workers=1)
+    questions = extractor.extract_questions()
+    if extractor.last_error is not None:
+        raise RuntimeError(extractor.last_error)
+    if not any(page['text'].strip() for page in extractor.pages):
+        # Failed rather than done-and-empty, so --retry-failed picks it up once e.g. Tesseract is fixed
+        ocr_failed = sum(1 for page in extractor.pages if page['source'] == 'ocr_failed')
+        if ocr_failed and ocr_failed == len(extractor.pages):
+            raise RuntimeError(f"OCR failed on all {ocr_failed} pages")
+        raise RuntimeError(f"No text extracted from {len(extractor.pages)} pages")
+    return {
+        'path': pdf_path,
+        'questions': questions,
+        'pages': len(extractor.pages),
+        'page_sources': extractor.get_page_sources(),
+        'seconds': round(time.perf_counter() - start, 3)
+    }
+
+
+def run_batch(
+    pdf_paths: List[str],
+    output_path: Path,
+    manifest_path: Path,
+    workers: int,
+    retry_failed: bool = False
+) -> Dict:
+    """
+    Extract many PDFs across a process pool, appending one JSONL line per paper to
+    output_path and its status to manifest_path. Files already recorded as done
+    (and unchanged since) are skipped, so an interrupted run picks up where it stopped.
+    """
+    statuses = load_manifest(manifest_path)
+    pending = []
+    for pdf_path in pdf_paths:
+        previous = statuses.get(pdf_path)
+        if previous is not None and os.path.exists(pdf_path):
+            unchanged = previous.get('signature') == _file_signature(pdf_path)
+            if unchanged and (previous['status'] == 'done' or (previous['status'] == 'failed' and not retry_failed)):
+                continue
+        pending.append(pdf_path)
+    
+    summary = {'files': 0, 'failed': 0, 'empty': 0, 'pages': 0, 'questions': 0, 'skipped': len(pdf_paths) - len(pending)}
+    logger.info(f"Batch: {len(pending)} PDFs to extract, {summary['skipped']} already in {manifest_path}")
+    
+    start = time.perf_counter()
+    with open(output_path, 'a', encoding='utf-8') as output, open(manifest_path, 'a', encoding='utf-8') as manifest, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as executor:
+        in_flight = {}
+        pending_iter = iter(pending)
+        try:
+            while True:
+                # Keep a couple of files per worker queued so results are written as they finish
+                for pdf_path in pending_iter:
+                    in_flight[executor.submit(_extract_for_batch, pdf_path)] = pdf_path
+                    if len(in_flight) >= workers * 2:
+                        break
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pdf_path = in_flight.pop(future)
+                    entry = {'path': pdf_path}
+                    try:
+                        entry['signature'] = _file_signature(pdf_path)
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Batch extraction failed for {pdf_path}: {e}")
+                        entry.update(status='failed', error=str(e))
+                        summary['failed'] += 1
+                    else:
+                        # The result is written before the manifest entry, so a done file always has output
+                        output.write(json.dumps(result, ensure_ascii=False) + '\n')
+                        output.flush()
+                        entry.update(status='done', questions=len(result['questions']), pages=result['pages'], seconds=result['seconds'])
+                        summary['pages'] += result['pages']
+                        summary['questions'] += len(result['questions'])
+                        if not result['questions']:
+                            summary['empty'] += 1
+                    summary['files'] += 1
+                    manifest.write(json.dumps(entry) + '\n')
+                    manifest.flush()
+        except KeyboardInterrupt:
+            logger.warning("Batch interrupted, rerun the same command to resume")
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    elapsed = time.perf_counter() - start
+    summary['seconds'] = round(elapsed, 2)
+    summary['files_per_min'] = round(summary['files'] / elapsed * 60, 2) if elapsed else 0.0
+    summary['pages_per_sec'] = round(summary['pages'] / elapsed, 2) if elapsed else 0.0
+    return summary
+
+
+def batch_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog='main.py batch', description='Extract questions from many PDFs')
+    parser.add_argument('source', help='Directory of PDFs, or a file listing one PDF path per line')
+    parser.add_argument('--output', default='output/batch_questions.jsonl', help='JSONL file results are appended to')
+    parser.add_argument('--manifest', default='output/batch_manifest.jsonl', help='Per-file status log used to resume')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Extraction processes')
+    parser.add_argument('--retry-failed', action='store_true', help='Extract files that failed in an earlier run again')
+    args = parser.parse_args(argv)
+    
+    if not os.path.exists(args.source):
+        print(f"Error: {args.source} does not exist")
+        sys.exit(1)
+    
+    # Per-page extraction logging is far too verbose across thousands of files
+    logging.getLogger("pdf_extractor").setLevel(logging.WARNING)
+    
+    output_path = Path(args.output)
+    manifest_path = Path(args.manifest)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    summary = run_batch(collect_pdfs(args.source), output_path, manifest_path, max(1, args.workers), args.retry_failed)
+    logger.info(
+        f"Batch finished: {summary['files']} files in {summary['seconds']}s "
+        f"({summary['files_per_min']} files/min, {summary['pages_per_sec']} pages/sec), "
+        f"{summary['questions']} questions, {summary['failed']} failed, {summary['empty']} without questions, "
+        f"{summary['skipped']} skipped from earlier runs"
+    )
+    if summary['failed']:
+        sys.exit(1)
+
+
+def run_pipeline(
+    pdf_path: str,
+    client: GeminiClient,
+    queue_size: int = 16,
+    checkpoint_path: Optional[str] = None,
+    resume: bool = False
+) -> List[Dict]:
+    """
+    Extract and answer one PDF with the two stages overlapped. A producer thread
+    hands each group's questions over as soon as the group is parsed; the bounded
+    queue blocks extraction whenever answering falls behind. Answering goes
+    through the same run as process_questions, so MCQs are batched, the paper's
+    token budget applies and every answer is checkpointed; with resume, questions
+    already answered in the checkpoint are not sent again.
+    """
+    handoff: "queue.Queue[Optional[List[Question]]]" = queue.Queue(maxsize=queue_size)
+    errors: List[BaseException] = []
+    timings = {}
+    
+    def produce():
+        start = time.perf_counter()
+        try:
+            extractor = PDFExtractor(pdf_path)
+            for group, questions in extractor.iter_question_groups():
+                logger.info(f"{group}: {len(questions)} questions ready after {time.perf_counter() - start:.1f}s")
+                handoff.put([Question.from_dict(question) for question in questions])
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            timings['extract'] = time.perf_counter() - start
+            handoff.put(None)
+    
+    start = time.perf_counter()
+    producer = threading.Thread(target=produce, name='pipeline-extract', daemon=True)
+    producer.start()
+    
+    # Groups are answered as they arrive; results come back in question order
+    answer_start = None
+    run = client.open_run(checkpoint_path, resume, pdf_path)
+    try:
+        while True:
+            group = handoff.get()
+            if group is None:
+                break
+            if answer_start is None:
+                answer_start = time.perf_counter()
+            run.add(group)
+            # Stop taking groups off the queue while the answering stage is saturated
+            run.collect(client.max_concurrency)
+    finally:
+        results = run.close()
+    answer_seconds = time.perf_counter() - answer_start if answer_start is not None else 0.0
+    producer.join()
+    
+    if errors:
+        raise errors[0]
+    logger.info(
+        f"Pipeline finished in {time.perf_counter() - start:.1f}s "
+        f"(extraction {timings['extract']:.1f}s, answering stage active {answer_seconds:.1f}s, "
+        f"{len(results)} questions, {run.resumed} already answered in {run.checkpoint_path})"
+    )
+    client.log_usage(run.account)
+    return results
+
+
+def pipeline_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog='main.py pipeline', description='Extract and answer a PDF with overlapped stages')
+    parser.add_argument('pdf', help='PDF file to process')
+    parser.add_argument('--queue-size', type=int, default=16, help='Question groups buffered between extraction and answering')
+    parser.add_argument('--resume', action='store_true', help='Skip questions already answered in the checkpoint')
+    args = parser.parse_args(argv)
+    
+    if not os.path.exists(args.pdf):
+        print(f"Error: File {args.pdf} does not exist")
+        sys.exit(1)
+    
+    _, output_dir = setup_directories()
+    pdf_name = Path(args.pdf).stem
+    try:
+        client = GeminiClient(args.pdf)
+        results = run_pipeline(
+            args.pdf, client, max(1, args.queue_size),
+            checkpoint_path=str(output_dir / f"{pdf_name}_answers.jsonl"), resume=args.resume
+        )
+    except Exception as e:
+        logger.error(f"Error in pipeline: {str(e)}")
+        sys.exit(1)
+    
+    if not results:
+        logger.error("No questions extracted from PDF")
+        sys.exit(1)
+    client.save_results(results, str(output_dir / f"{pdf_name}_answers.json"))
+
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python main.py <pdf_file>")
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        batch_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'pipeline':
+        pipeline_main(sys.argv[2:])
+        return
+    
+    resume = '--resume' in sys.argv[2:]
+    if len(sys.argv) != (3 if resume else 2):
+        print("Usage: python main.py <pdf_file> [--resume]")
+        print("       python main.py batch <pdf_dir_or_list> [--output FILE] [--manifest FILE] [--workers N]")
+        print("       python main.py pipeline <pdf_file> [--queue-size N] [--resume]")
         sys.exit(1)
     
     pdf_path = sys.argv[1]
@@ -109,12 +399,14 @@ def main():
         logger.info("Initializing Gemini client")
         client = GeminiClient(pdf_path)
         logger.info("Processing questions with Gemini")
-        results = client.process_questions(questions)
+        results = client.process_questions(questions, resume=resume)
         
         # Save results
         logger.info("Saving results")
         if results:
-            logger.info(f"Pipeline completed successfully. Results saved to output/{os.path.splitext(os.path.basename(pdf_path))[0]}_answers.json")
+            output_json = os.path.join('output', f"{os.path.splitext(os.path.basename(pdf_path))[0]}_answers.json")
+            client.save_results(results, output_json)
+            logger.info(f"Pipeline completed successfully. Results saved to {output_json}")
         else:
             logger.error("No results generated")
             sys.exit(1)
@@ -0,0 +1,194 @@
+"""
+Persistent OCR worker pool.
+Each worker is a long-lived process that loads the Tesseract language model
+once and then recognises page images sent to it over a pipe, so pages and
+PDFs processed by the same webhook process reuse warm workers. Keeping the
+model loaded needs tesserocr (requirements-ocr.txt); without it the pool
+starts with a warning and workers run the tesseract CLI per page.
+"""
+
+import os
+import queue
+import logging
+import threading
+import importlib.util
+import multiprocessing
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a single page before the worker is considered hung
+DEFAULT_PAGE_TIMEOUT = 120
+
+
+def _worker_main(conn, lang: str) -> None:
+    """Worker loop: load the OCR engine once, then serve page images until told to stop."""
+    try:
+        # tesserocr keeps the model loaded in-process and accepts raw pixel buffers
+        import tesserocr
+        api = tesserocr.PyTessBaseAPI(lang=lang)
+
+        def recognise(width, height, stride, samples):
+            api.SetImageBytes(samples, width, height, 1, stride)
+            return api.GetUTF8Text()
+    except ImportError:
+        # Without tesserocr each page still spawns the tesseract CLI; OCRWorkerPool warns about it at startup
+        import pytesseract
+        from PIL import Image
+
+        def recognise(width, height, stride, samples):
+            image = Image.frombuffer("L", (width, height), samples, "raw", "L", stride, 1)
+            return pytesseract.image_to_string(image, lang=lang)
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+        try:
+            conn.send(('ok', recognise(*job)))
+        except Exception as e:
+            conn.send(('error', str(e)))
+    conn.close()
+
+
+class _Worker:
+    """A single OCR worker process and the parent end of its pipe."""
+
+    def __init__(self, ctx, lang: str):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, lang), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self, timeout: float = 5) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+
+
+class OCRWorkerPool:
+    """
+    Pool of long-lived OCR worker processes shared across pages and PDFs.
+    Safe to call from several threads; each call borrows one idle worker.
+    """
+
+    def __init__(self, size: int, lang: str = 'eng', page_timeout: float = DEFAULT_PAGE_TIMEOUT):
+        self.size = max(1, size)
+        self.lang = lang
+        self.page_timeout = page_timeout
+        # spawn keeps workers independent of the threads running in the webhook process
+        self._ctx = multiprocessing.get_context('spawn')
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.restarts = 0
+        # Workers load tesserocr when it is installed, and fall back to pytesseract otherwise
+        self.engine = 'tesserocr' if importlib.util.find_spec('tesserocr') is not None else 'pytesseract'
+
+        for _ in range(self.size):
+            worker = _Worker(self._ctx, self.lang)
+            self._workers.append(worker)
+            self._idle.put(worker)
+        logger.info(f"Started OCR worker pool with {self.size} workers (lang={self.lang}, engine={self.engine})")
+        if self.engine != 'tesserocr':
+            logger.warning(
+                "tesserocr is not installed, so OCR pool workers run the tesseract CLI and reload the "
+                "language model for every page; install requirements-ocr.txt or set OCR_POOL_SIZE=0"
+            )
+
+    def ocr(self, width: int, height: int, stride: int, samples: bytes) -> str:
+        """OCR a grayscale page image given as raw 8-bit samples."""
+        if self._closed:
+            raise RuntimeError("OCR worker pool is closed")
+
+        worker = self._idle.get()
+        try:
+            for attempt in range(2):
+                if not worker.is_alive():
+                    worker = self._recycle(worker)
+                try:
+                    worker.conn.send((width, height, stride, samples))
+                    if not worker.conn.poll(self.page_timeout):
+                        raise TimeoutError(f"OCR worker did not respond within {self.page_timeout}s")
+                    status, payload = worker.conn.recv()
+                except (EOFError, OSError, BrokenPipeError) as e:
+                    # The worker crashed mid-page; replace it and retry once on a fresh one
+                    logger.warning(f"OCR worker crashed ({type(e).__name__}: {e}), restarting (attempt {attempt + 1})")
+                    worker = self._recycle(worker)
+                    continue
+                except TimeoutError:
+                    worker = self._recycle(worker)
+                    raise
+                if status == 'error':
+                    raise RuntimeError(payload)
+                return payload
+            raise RuntimeError("OCR worker crashed repeatedly on this page")
+        finally:
+            self._idle.put(worker)
+
+    def _recycle(self, worker: _Worker) -> _Worker:
+        """Replace a dead or hung worker with a fresh process."""
+        worker.stop(timeout=1)
+        replacement = _Worker(self._ctx, self.lang)
+        with self._lock:
+            self._workers = [replacement if w is worker else w for w in self._workers]
+            self.restarts += 1
+        return replacement
+
+    def health_check(self) -> int:
+        """Restart any idle worker that has died. Returns the number of workers recycled."""
+        recycled = 0
+        checked = []
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if not worker.is_alive():
+                worker = self._recycle(worker)
+                recycled += 1
+            checked.append(worker)
+        for worker in checked:
+            self._idle.put(worker)
+        if recycled:
+            logger.warning(f"OCR health check recycled {recycled} dead workers")
+        return recycled
+
+    def close(self) -> None:
+        """Stop all workers."""
+        self._closed = True
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+
+
+_default_pool: Optional[OCRWorkerPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> Optional[OCRWorkerPool]:
+    """Return the process-wide pool sized by OCR_POOL_SIZE, or None when it is disabled."""
+    global _default_pool
+    size = int(os.getenv('OCR_POOL_SIZE', '0'))
+    if size <= 0:
+        return None
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = OCRWorkerPool(size, lang=os.getenv('OCR_LANG', 'eng'))
+        else:
+            _default_pool.health_check()
+        return _default_pool
@@ -0,0 +1,91 @@
+"""
+Pre-OCR page classification over rendered grayscale pixmaps.
+Ink is measured with NumPy directly on the pixmap sample buffer, so blank
+backs, rough-work sheets and empty scans are skipped before Tesseract sees
+them, and pages with content are cropped to it. A page counts as content once
+it holds a run of inked rows as tall as a line of small text, whatever the
+fraction of the page that is, so a sheet with one question is still read.
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Pixels darker than this count as ink
+INK_THRESHOLD = 160
+# On a grey scan ink must also be this much darker than the paper tone
+MIN_INK_CONTRAST = 60
+# A row is inked when it holds at least this many ink pixels among the sampled columns
+MIN_ROW_INK_PX = 2
+# Pages without a run of inked rows this tall (about the x-height of 8pt text) are treated as blank,
+# which also skips ruled rough-work sheets and scanner specks
+MIN_TEXT_LINE_PT = 4.0
+# Blank pages whose pixel standard deviation is below this are reported as a flat tone
+MIN_PIXEL_STD = 6.0
+# Border ignored when measuring ink, so scanner shadows along the edges do not count as content
+EDGE_BAND_RATIO = 0.02
+# Padding kept around the detected content so characters on its edge are not clipped
+CONTENT_MARGIN_PX = 12
+# Statistics are sampled on every Nth row and column; the bounding box uses every pixel
+SAMPLE_STEP = 2
+
+
+class PageClass(NamedTuple):
+    """Outcome of classifying one rendered page."""
+    skip_reason: Optional[str]
+    bbox: Optional[Tuple[int, int, int, int]]  # x0, y0, x1, y1 in pixels
+    ink_ratio: float
+    pixel_std: float
+
+
+def pixmap_array(width: int, height: int, stride: int, samples) -> np.ndarray:
+    """View an 8-bit grayscale sample buffer as a height x width array without copying."""
+    return np.frombuffer(samples, dtype=np.uint8, count=height * stride).reshape(height, stride)[:, :width]
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values in a 1-D boolean array."""
+    if not mask.any():
+        return 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+    return int((edges[1::2] - edges[::2]).max())
+
+
+def classify_page(pixels: np.ndarray, dpi: float = 144.0) -> PageClass:
+    """Decide whether a page rendered at dpi is worth recognising and where its content is."""
+    height, width = pixels.shape
+    band_y = int(height * EDGE_BAND_RATIO)
+    band_x = int(width * EDGE_BAND_RATIO)
+    inner = pixels[band_y:height - band_y, band_x:width - band_x]
+    if inner.size == 0:
+        return PageClass('empty', None, 0.0, 0.0)
+
+    sample = inner[::SAMPLE_STEP, ::SAMPLE_STEP]
+    pixel_std = float(sample.std())
+    # The most common tone is the paper; ink has to stand out from it
+    paper = int(np.bincount(sample.ravel(), minlength=256).argmax())
+    ink_level = min(INK_THRESHOLD, paper - MIN_INK_CONTRAST)
+
+    # Every row, but only the sampled columns, so a thin line of text is not stepped over
+    row_ink = inner[:, ::SAMPLE_STEP] < ink_level
+    ink_ratio = float(np.count_nonzero(row_ink)) / row_ink.size
+    line_rows = MIN_TEXT_LINE_PT * dpi / 72
+    if _longest_run(np.count_nonzero(row_ink, axis=1) >= MIN_ROW_INK_PX) < line_rows:
+        return PageClass('uniform' if pixel_std < MIN_PIXEL_STD else 'low_ink', None, ink_ratio, pixel_std)
+
+    ink = inner < ink_level
+    rows = np.flatnonzero(ink.any(axis=1))
+    cols = np.flatnonzero(ink.any(axis=0))
+    bbox = (
+        max(int(cols[0]) + band_x - CONTENT_MARGIN_PX, 0),
+        max(int(rows[0]) + band_y - CONTENT_MARGIN_PX, 0),
+        min(int(cols[-1]) + band_x + CONTENT_MARGIN_PX + 1, width),
+        min(int(rows[-1]) + band_y + CONTENT_MARGIN_PX + 1, height)
+    )
+    return PageClass(None, bbox, ink_ratio, pixel_std)
+
+
+def crop_to_content(pixels: np.ndarray, bbox: Tuple[int, int, int, int]) -> np.ndarray:
+    """Return the content region as a contiguous array, ready to hand to the OCR engine."""
+    x0, y0, x1, y1 = bbox
+    return np.ascontiguousarray(pixels[y0:y1, x0:x1])
@@ -0,0 +1,120 @@
+"""
+Persistent store of raw per-page extraction text.
+Each paper is kept as one gzip-compressed JSON file keyed by the SHA-256 of
+the PDF, holding the page text, the layout rows of every text page and the
+questions last parsed from them, so parser changes can be replayed over the
+whole corpus without downloading or OCRing a single PDF again.
+"""
+
+import os
+import gzip
+import json
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = '.json.gz'
+
+
+class PageTextStore:
+    """Directory of compressed per-paper page text, one file per PDF hash."""
+
+    def __init__(self, store_dir: str, compress_level: int = 6):
+        self.store_dir = store_dir
+        self.compress_level = compress_level
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def _entry_path(self, pdf_hash: str) -> str:
+        return os.path.join(self.store_dir, f"{pdf_hash}{_SUFFIX}")
+
+    def put(
+        self,
+        pdf_hash: str,
+        source: str,
+        version: str,
+        pages: List[Dict],
+        questions: List[Dict],
+        layout_lines: Optional[List] = None
+    ) -> None:
+        """Store the pages of one paper, replacing any earlier entry for the same PDF."""
+        self._write(pdf_hash, {
+            'pdf_hash': pdf_hash,
+            'source': source,
+            'extractor_version': version,
+            'stored_at': datetime.now().isoformat(),
+            'pages': pages,
+            'layout_lines': [list(line) for line in layout_lines or []],
+            'questions': questions
+        })
+
+    def get(self, pdf_hash: str) -> Optional[Dict]:
+        """Return the stored entry for a PDF hash, or None if it was never stored."""
+        return self.load(self._entry_path(pdf_hash))
+
+    def load(self, path: str) -> Optional[Dict]:
+        """Read one entry file, returning None when it is missing or unreadable."""
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable page text entry {os.path.basename(path)}: {e}")
+            return None
+
+    def update_questions(self, pdf_hash: str, questions: List[Dict], version: str) -> None:
+        """Replace the stored questions of a paper after it has been re-parsed."""
+        entry = self.get(pdf_hash)
+        if entry is None:
+            raise KeyError(pdf_hash)
+        entry['questions'] = questions
+        entry['extractor_version'] = version
+        self._write(pdf_hash, entry)
+
+    def paths(self) -> List[str]:
+        """Return the entry file of every stored paper, sorted for stable processing order."""
+        with os.scandir(self.store_dir) as it:
+            return sorted(item.path for item in it if item.name.endswith(_SUFFIX))
+
+    def __iter__(self) -> Iterator[Dict]:
+        for path in self.paths():
+            entry = self.load(path)
+            if entry is not None:
+                yield entry
+
+    def __len__(self) -> int:
+        return len(self.paths())
+
+    def _write(self, pdf_hash: str, entry: Dict) -> None:
+        # Write to a temp file first so a concurrent reparse never reads a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=self.compress_level) as f:
+                f.write(json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+            os.replace(tmp_path, self._entry_path(pdf_hash))
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+_default_store: Optional[PageTextStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store() -> Optional[PageTextStore]:
+    """Return the process-wide store configured via PAGE_TEXT_STORE_DIR, if any."""
+    global _default_store
+    store_dir = os.getenv('PAGE_TEXT_STORE_DIR')
+    if not store_dir:
+        return None
+    with _default_store_lock:
+        if _default_store is None or _default_store.store_dir != store_dir:
+            _default_store = PageTextStore(store_dir)
+        return _default_store
@@ -1,222 +1,928 @@
 import os
+import json
+import time
 import logging
-from typing import List, Dict
+from bisect import bisect_left
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import fitz  # PyMuPDF
 import re
+import numpy as np
 import pytesseract
 from PIL import Image
-import io
+
+from extraction_cache import ExtractionCache, get_default_cache, hash_pdf
+from layout_parser import LayoutLine, iter_layout_lines, parse_group_a_layout
+from ocr_pool import OCRWorkerPool, get_default_pool
+from page_classifier import classify_page, crop_to_content, pixmap_array
+from page_store import PageTextStore, get_default_store
+from question_model import QuestionBatch
+from stage_timer import StageTimer, TimingHook
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction or parsing output changes so cached results are not reused
+EXTRACTOR_VERSION = "8"
+
+# Boilerplate stripped from the whole document. The patterns are combined into
+# one alternation so the text is scanned once; more specific alternatives come
+# first so composite headers like "Full Marks : 70" are removed whole. Group
+# headers lose only their description, since the marker delimits the section.
+_DOCUMENT_BOILERPLATE = [
+    r'(?<=Group-A)\s*\(Very Short Answer Type Question\)',
+    r'(?<=Group-B)\s*\([^)]+\)',
+    r'(?<=Group-C)\s*\([^)]+\)',
+    r'Answer any \w+ of the following\s*:?',
+    r'\[\s*\d+\s*x\s*\d+\s*=\s*\d+\s*\]',
+    r'End of paper',
+    r'Time\s*:\s*\d+\s*hours?',
+    r'Maximum Marks?\s*:\s*\d+',
+    r'Full Marks?\s*:\s*\d+',
+    r'Marks?\s*:\s*\d+',
+    r'Instructions?\s*:',
+    r'Note\s*:',
+    r'Attempt any \w+ questions?',
+    r'All questions? are compulsory',
+    r'Page\s*\d+\s*of\s*\d+',
+    r'Question Paper Code\s*:',
+    r'Roll No\.?\s*:',
+    r'Name\s*:',
+    r'Subject\s*:',
+    r'Course\s*:',
+    r'Semester\s*:',
+    r'Date\s*:',
+    r'Duration\s*:'
+]
+
+# Leftover headers and instructions removed from the Group-A section
+_GROUP_A_BOILERPLATE = [
+    r'Group\s*-?\s*A.*?Question\)',
+    r'Answer any \w+ of the following\s*:?',
+    r'\[\s*\d+\s*x\s*\d+\s*=\s*\d+\s*\]',
+    r'Choose the correct option',
+    r'Select the correct answer',
+    r'Tick the correct option',
+    r'The Figures in the margin indicate full marks',
+    r'Candidate are required to give their answers',
+    r'Time Allotted\s*:\s*\d+\s*Hours',
+    r'Full Marks\s*:\s*\d+',
+    r'Paper Code\s*:',
+    r'UPID\s*:',
+    r'MAULANA ABUL KALAM AZAD UNIVERSITY',
+    r'CS/B\.TECH',
+    r'Computer Networks',
+    r'---\s*Page\s*\d+\s*---'
+]
+
+
+class _PatternStripper:
+    """Removes a fixed set of patterns from text in one case-insensitive pass."""
+
+    def __init__(self, patterns: List[str], flags: int = 0):
+        alternation = '|'.join(f'(?:{pattern})' for pattern in patterns)
+        self._regex = re.compile(alternation, flags | re.IGNORECASE)
+        # Matching lowercased text against lowercased patterns avoids case-folding
+        # at every position, which is most of the cost of an IGNORECASE scan.
+        # This relies on the patterns using no uppercase escapes (\S, \W, \D, \B).
+        self._lower_regex = re.compile(alternation.lower(), flags)
+
+    def strip(self, text: str) -> str:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Some characters change length when lowercased, so offsets would not line up
+            return self._regex.sub('', text)
+        
+        parts = []
+        last = 0
+        for match in self._lower_regex.finditer(lowered):
+            parts.append(text[last:match.start()])
+            last = match.end()
+        parts.append(text[last:])
+        return ''.join(parts)
+
+
+def _collapse_whitespace(text: str) -> str:
+    """Equivalent to re.sub(r'\s+', ' ', text) without going through the regex engine."""
+    collapsed = ' '.join(text.split())
+    if text[:1].isspace():
+        collapsed = ' ' + collapsed
+    if text[-1:].isspace() and collapsed != ' ':
+        collapsed += ' '
+    return collapsed
+
+
+_DOCUMENT_BOILERPLATE_STRIPPER = _PatternStripper(_DOCUMENT_BOILERPLATE)
+_GROUP_A_BOILERPLATE_STRIPPER = _PatternStripper(_GROUP_A_BOILERPLATE, re.DOTALL)
+
+# Question and option line formats recognised by the numbered Group-A strategy
+_QUESTION_LINE_PATTERNS = [
+    re.compile(r'^(\d+)\.\s*(.+)', re.IGNORECASE),     # 1. Question text
+    re.compile(r'^(\d+)\)\s*(.+)', re.IGNORECASE),     # 1) Question text
+    re.compile(r'^\((\d+)\)\s*(.+)', re.IGNORECASE),   # (1) Question text
+    re.compile(r'^Q\.?\s*(\d+)\s*[.:]?\s*(.+)', re.IGNORECASE)  # Q.1 Question text or Q1:
+]
+_OPTION_LINE_PATTERNS = [
+    re.compile(r'^[\(\)]*[a-dA-D][\)\(]\s*(.+)', re.IGNORECASE),  # a) text or (a) text
+    re.compile(r'^[a-dA-D][.:\-]\s*(.+)', re.IGNORECASE),        # a. text or a: text
+    re.compile(r'^\([a-dA-D]\)\s*(.+)', re.IGNORECASE),          # (a) text
+    re.compile(r'^[a-dA-D]\s+(.+)', re.IGNORECASE)               # a text (space separated)
+]
+
+# Numbered question split used for Group-B and Group-C
+_NUMBERED_QUESTION_RE = re.compile(
+    r'(?:Question\s*)?Q?(\d+)[\:\.]?\s*(.+?)(?=(?:Question\s*)?Q?\d+[\:\.]|$)',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Group markers and the text that ends each group's section
+_SECTION_BOUNDARIES = [
+    ('Group-A', 'Group-B'),
+    ('Group-B', 'Group-C'),
+    ('Group-C', 'END OF PAPER')
+]
+
+
+def _marker_variants(marker: str) -> List[str]:
+    """Spellings accepted for a section marker, in order of preference."""
+    variants = []
+    for variant in (marker, marker.replace('-', ''), marker.replace('-', ' '), marker.upper(), marker.lower()):
+        if variant not in variants:
+            variants.append(variant)
+    return variants
+
+
+_SECTION_MARKER_VARIANTS = {
+    marker: _marker_variants(marker)
+    for marker in dict.fromkeys(m for boundary in _SECTION_BOUNDARIES for m in boundary)
+}
+
+# All literal marker spellings, so every marker is located in one scan of the text
+_SECTION_MARKER_RE = re.compile('|'.join(
+    re.escape(variant)
+    for variant in sorted(
+        {v for variants in _SECTION_MARKER_VARIANTS.values() for v in variants},
+        key=len,
+        reverse=True
+    )
+))
+
+# Any spelling of the Group-A marker, used to find where a new paper starts
+_GROUP_A_MARKER_RE = re.compile('|'.join(re.escape(v) for v in _SECTION_MARKER_VARIANTS['Group-A']))
+
+# Fallback for headers like "Group - A (Very Short Answer Type Question)"
+_GROUP_A_HEADER_RE = re.compile(r'Group\s*-?\s*A.*?Question\)', re.IGNORECASE | re.DOTALL)
+
+# Group headers and instructions skipped to reach the first question of a section
+_SECTION_INTRO_PATTERNS = [
+    re.compile(r'(?:Answer any \w+ of the following\s*:?)', re.IGNORECASE),
+    re.compile(r'(?:\[\s*\d+\s*x\s*\d+\s*=\s*\d+\s*\])', re.IGNORECASE),
+    re.compile(r'(?:Very Short Answer Type Question\s*)', re.IGNORECASE),
+    re.compile(r'(?:Short Answer Type Question\s*)', re.IGNORECASE),
+    re.compile(r'(?:Long Answer Type Question\s*)', re.IGNORECASE)
+]
+
+_NON_SPACE_RE = re.compile(r'\S')
+
+
+class SectionRange(NamedTuple):
+    """Offsets of a group section within the cleaned text and the marker spellings that matched."""
+    start: int
+    end: int
+    start_variant: Optional[str]
+    end_variant: Optional[str]
+
+
+# Default OCR rendering resolution; 144 DPI matches the previous fixed 2x zoom
+DEFAULT_OCR_DPI = 144
+# Longest rendered side in pixels, so oversized pages do not blow up memory
+OCR_MAX_SIDE_PX = 4000
+
+# Document handle and render settings held by each OCR worker process, set by the pool initializer
+_worker_doc = None
+_worker_dpi = DEFAULT_OCR_DPI
+_worker_skip_blank = True
+
+
+def _ocr_zoom(page, dpi: int) -> float:
+    """Pick the render zoom for a page from the target DPI, capped by page size."""
+    zoom = dpi / 72
+    longest_side = max(page.rect.width, page.rect.height)
+    if longest_side * zoom > OCR_MAX_SIDE_PX:
+        zoom = OCR_MAX_SIDE_PX / longest_side
+    return zoom
+
+
+def _render_page_for_ocr(page, dpi: int):
+    """Render a page to a single-channel grayscale pixmap for OCR."""
+    zoom = _ocr_zoom(page, dpi)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+    # Record the effective resolution, which the blank-page check needs to size a line of text
+    pix.set_dpi(round(zoom * 72), round(zoom * 72))
+    return pix
+
+
+def _pixmap_to_image(pix) -> Image.Image:
+    """Wrap the pixmap sample buffer in a PIL image without copying or encoding it."""
+    # The image shares memory with pix, so pix must outlive it
+    return Image.frombuffer("L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1)
+
+
+def _content_pixels(pix) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """Return the page's content region, or the reason the page should not be OCR'd."""
+    page_class = classify_page(pixmap_array(pix.width, pix.height, pix.stride, pix.samples_mv), pix.xres)
+    if page_class.skip_reason is not None:
+        return None, page_class.skip_reason
+    return crop_to_content(pixmap_array(pix.width, pix.height, pix.stride, pix.samples_mv), page_class.bbox), None
+
+
+def _ocr_page(page, dpi: int = DEFAULT_OCR_DPI, skip_blank: bool = True) -> Tuple[str, Optional[str]]:
+    """Render a single page and run OCR on it, returning (text, skip_reason)."""
+    pix = _render_page_for_ocr(page, dpi)
+    if not skip_blank:
+        return pytesseract.image_to_string(_pixmap_to_image(pix), lang='eng'), None
+    pixels, skip_reason = _content_pixels(pix)
+    if skip_reason is not None:
+        return '', skip_reason
+    return pytesseract.image_to_string(Image.fromarray(pixels, mode="L"), lang='eng'), None
+
+
+def _init_ocr_worker(pdf_path: str, dpi: int, skip_blank: bool = True) -> None:
+    """Open the PDF once per worker process."""
+    global _worker_doc, _worker_dpi, _worker_skip_blank
+    _worker_doc = fitz.open(pdf_path)
+    _worker_dpi = dpi
+    _worker_skip_blank = skip_blank
+
+
+def _ocr_page_worker(page_num: int) -> Tuple[int, Optional[str], Optional[str], Optional[str], float, float]:
+    """OCR one page inside a worker process, returning (page_num, text, error, skip_reason, wall, cpu)."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    skip_reason = None
+    try:
+        (text, skip_reason), error = _ocr_page(_worker_doc[page_num], _worker_dpi, _worker_skip_blank), None
+    except Exception as e:
+        text, error = None, str(e)
+    return page_num, text, error, skip_reason, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
 class PDFExtractor:
-    def __init__(self, pdf_path: str):
+    # Pages with less text than this that also carry images are treated as scans
+    MIN_TEXT_CHARS = 50
+
+    def __init__(
+        self,
+        pdf_path: str,
+        ocr_workers: Optional[int] = None,
+        cache: Optional[ExtractionCache] = None,
+        ocr_dpi: Optional[int] = None,
+        ocr_pool: Optional[OCRWorkerPool] = None,
+        max_buffer_chars: Optional[int] = None,
+        timing_hook: Optional[TimingHook] = None,
+        layout_mcqs: Optional[bool] = None,
+        skip_blank_pages: Optional[bool] = None,
+        page_store: Optional[PageTextStore] = None
+    ):
         self.pdf_path = pdf_path
         self.logger = logger
+        # Number of processes used for OCR; 1 keeps the serial path
+        if ocr_workers is None:
+            ocr_workers = int(os.getenv('OCR_WORKERS', '1'))
+        self.ocr_workers = max(1, ocr_workers)
+        # Target resolution for rendering scanned pages
+        if ocr_dpi is None:
+            ocr_dpi = int(os.getenv('OCR_DPI', str(DEFAULT_OCR_DPI)))
+        self.ocr_dpi = ocr_dpi
+        # Persistent OCR workers; when unset the pool from OCR_POOL_SIZE is used if enabled
+        self.ocr_pool = ocr_pool
+        # Per-page results of the last extraction: page_number, source, text (and skip_reason for skipped pages)
+        self.pages: List[Dict] = []
+        # Marker spellings that delimited each group section in the last parse
+        self.section_markers: Dict[str, Dict] = {}
+        # Falls back to the cache configured through EXTRACTION_CACHE_DIR
+        self.cache = cache if cache is not None else get_default_cache()
+        self.pdf_hash: Optional[str] = None
+        # Error that made the last extract_questions call return no questions, if any
+        self.last_error: Optional[str] = None
+        # Page text iter_questions may hold before parsing what it has
+        if max_buffer_chars is None:
+            max_buffer_chars = int(os.getenv('EXTRACTION_BUFFER_CHARS', '2000000'))
+        self.max_buffer_chars = max_buffer_chars
+        # Process pool kept open by iter_pages across its page windows
+        self._ocr_executor: Optional[ProcessPoolExecutor] = None
+        # Per-stage and per-page wall/CPU time of the last extraction
+        self.timing_hook = timing_hook
+        self.timer = StageTimer(timing_hook)
+        # Parse Group-A from text-layer geometry before falling back to the text strategies
+        if layout_mcqs is None:
+            layout_mcqs = os.getenv('LAYOUT_MCQ_PARSING', '1') == '1'
+        self.layout_mcqs = layout_mcqs
+        # Layout rows read for Group-A in the last extraction, kept so the store can replay them
+        self.layout_lines: List[LayoutLine] = []
+        # Classify rendered pages before OCR, skipping blank ones and cropping the rest to their content
+        if skip_blank_pages is None:
+            skip_blank_pages = os.getenv('OCR_SKIP_BLANK_PAGES', '1') == '1'
+        self.skip_blank_pages = skip_blank_pages
+        # Skip reasons of the pages passed to the last _ocr_pages call, by 0-based page index
+        self._skipped_pages: Dict[int, str] = {}
+        # Raw page text is persisted here for parser-only reprocessing (PAGE_TEXT_STORE_DIR)
+        self.page_store = page_store if page_store is not None else get_default_store()
 
     def extract_questions(self) -> List[Dict]:
-        """Extract questions from PDF using OCR if needed."""
+        """Extract questions from PDF, using OCR only for pages without a text layer."""
+        self.timer = StageTimer(self.timing_hook)
+        self.last_error = None
         try:
-            # First try direct text extraction
+            with self.timer.stage('total'):
+                return self._extract_questions()
+        except Exception as e:
+            self.logger.error(f"Failed to extract questions from PDF: {e}")
+            self.last_error = str(e)
+            return []
+        finally:
+            self._log_timings()
+
+    def extract_question_batch(self) -> QuestionBatch:
+        """Extract questions like extract_questions, returned as a column-oriented QuestionBatch."""
+        return QuestionBatch.from_dicts(self.extract_questions())
+
+    @property
+    def timings(self) -> Dict:
+        """Stage and page timings of the last extraction."""
+        return self.timer.summary()
+
+    def _log_timings(self) -> None:
+        """Emit stage totals of the last extraction as one structured log line."""
+        summary = self.timer.summary()
+        record = {'pdf': os.path.basename(self.pdf_path), 'pages': len(self.pages), 'stages': summary['stages']}
+        self.logger.info(f"Extraction timings: {json.dumps(record)}")
+
+    def _extract_questions(self) -> List[Dict]:
+        """Extraction pipeline behind extract_questions, timed stage by stage."""
+        with self.timer.stage('cache_lookup'):
+            cache_key = self._cache_key()
+            cached = self._cache_get(cache_key) if cache_key else None
+        # Entries written before markers and layout rows were cached are re-extracted
+        if cached is not None and 'section_markers' in cached:
+            self.pages = cached['pages']
+            self.section_markers = cached['section_markers']
+            self.layout_lines = [LayoutLine(*line) for line in cached['layout_lines']]
+            self.logger.info(f"Extraction cache hit for {self.pdf_hash[:12]}, {len(cached['questions'])} questions")
+            if self.page_store is not None:
+                with self.timer.stage('page_store'):
+                    self._store_pages(cached['questions'])
+            return cached['questions']
+        
+        with self.timer.stage('open'):
             doc = fitz.open(self.pdf_path)
-            text = ""
-            
-            # Check if we can extract text directly
-            for page in doc:
-                page_text = page.get_text()
-                if page_text.strip():
-                    text += page_text
-            
-            # If no text found, use OCR
-            if not text.strip():
-                self.logger.info("No text found, using OCR extraction...")
-                text = self._extract_text_with_ocr(doc)
-            else:
-                self.logger.info(f"Direct text extraction successful, extracted {len(text)} characters")
-            
+        try:
+            with self.timer.stage('extract_pages'):
+                self.pages = self._extract_pages(doc)
+            group_a_questions = None
+            if self.layout_mcqs:
+                with self.timer.stage('group_a_layout'):
+                    group_a_questions = self._parse_group_a_from_layout(doc)
+        finally:
             doc.close()
-            
-            if not text.strip():
-                self.logger.warning("No text could be extracted from PDF")
-                return []
-            
-            # Log a sample of the extracted text for debugging
-            self.logger.debug(f"Sample extracted text (first 500 chars): {text[:500]}")
-            
-            # Parse questions from text
-            questions = self._parse_text_for_questions(text)
-            self.logger.info(f"Extracted {len(questions)} questions from PDF.")
-            
-            # Log question summary
-            if questions:
-                self.logger.info("Question extraction summary:")
-                for q in questions[:3]:  # Log first 3 questions for verification
-                    self.logger.info(f"  {q.get('group', 'Unknown')} Q{q.get('question_number', '?')}: {q.get('text', '')[:100]}...")
-            
-            return questions
-            
+        
+        text = self._join_pages(self.pages)
+        ocr_pages = sum(1 for page in self.pages if page['source'] == 'ocr')
+        if ocr_pages:
+            self.logger.info(f"Hybrid extraction: {len(self.pages) - ocr_pages} text pages, {ocr_pages} OCR pages, {len(text)} characters")
+        else:
+            self.logger.info(f"Direct text extraction successful, extracted {len(text)} characters")
+        
+        if not text.strip():
+            self.logger.warning("No text could be extracted from PDF")
+            return []
+        
+        # Log a sample of the extracted text for debugging
+        self.logger.debug(f"Sample extracted text (first 500 chars): {text[:500]}")
+        
+        # Parse questions from text
+        with self.timer.stage('parse'):
+            questions = self._parse_text_for_questions(text, group_a_questions)
+        self.logger.info(f"Extracted {len(questions)} questions from PDF.")
+        
+        if cache_key:
+            with self.timer.stage('cache_store'):
+                self._cache_put(cache_key, questions)
+        if self.page_store is not None:
+            with self.timer.stage('page_store'):
+                self._store_pages(questions)
+        
+        # Log question summary
+        if questions:
+            self.logger.info("Question extraction summary:")
+            for q in questions[:3]:  # Log first 3 questions for verification
+                self.logger.info(f"  {q.get('group', 'Unknown')} Q{q.get('question_number', '?')}: {q.get('text', '')[:100]}...")
+        
+        return questions
+
+
+    def _cache_key(self) -> Optional[str]:
+        """Hash the PDF and build its cache key, or return None when caching is off."""
+        if self.cache is None:
+            return None
+        try:
+            self.pdf_hash = hash_pdf(self.pdf_path)
+        except OSError as e:
+            self.logger.warning(f"Could not hash PDF for caching: {e}")
+            return None
+        return ExtractionCache.make_key(self.pdf_hash, EXTRACTOR_VERSION, {
+            'ocr_dpi': self.ocr_dpi,
+            'skip_blank_pages': self.skip_blank_pages,
+            'layout_mcqs': self.layout_mcqs
+        })
+
+    def _cache_get(self, cache_key: str) -> Optional[Dict]:
+        try:
+            return self.cache.get(cache_key)
         except Exception as e:
-            self.logger.error(f"Failed to extract questions from PDF: {e}")
+            self.logger.warning(f"Extraction cache lookup failed: {e}")
+            return None
+
+    def _cache_put(self, cache_key: str, questions: List[Dict]) -> None:
+        try:
+            self.cache.put(cache_key, self.pages, questions, self.section_markers, self.layout_lines)
+        except Exception as e:
+            self.logger.warning(f"Failed to store extraction result in cache: {e}")
+
+    def _store_pages(self, questions: List[Dict]) -> None:
+        """Persist the raw page text of this extraction so it can be re-parsed later."""
+        try:
+            if self.pdf_hash is None:
+                self.pdf_hash = hash_pdf(self.pdf_path)
+            self.page_store.put(
+                self.pdf_hash,
+                os.path.basename(self.pdf_path),
+                EXTRACTOR_VERSION,
+                self.pages,
+                questions,
+                self.layout_lines
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to store page text: {e}")
+
+    def parse_stored_pages(self, pages: List[Dict], layout_lines: Optional[List] = None) -> List[Dict]:
+        """Re-run question parsing over page text persisted by an earlier extraction, without the PDF."""
+        self.pages = pages
+        self.layout_lines = [LayoutLine(*line) for line in layout_lines or []]
+        group_a_questions = None
+        if self.layout_mcqs and self.layout_lines:
+            group_a_questions = self._parse_layout_lines(self.layout_lines)
+        text = self._join_pages(pages)
+        if not text.strip():
             return []
+        return self._parse_text_for_questions(text, group_a_questions)
 
-    def _extract_text_with_ocr(self, doc) -> str:
-        """Extract text using OCR from PDF images."""
-        all_text = ""
+    def get_page_sources(self) -> List[Dict]:
+        """Return the page number, text source and any OCR skip reason of each page from the last extraction."""
+        return [
+            {
+                'page_number': page['page_number'],
+                'source': page['source'],
+                'chars': len(page['text']),
+                'skip_reason': page.get('skip_reason')
+            }
+            for page in self.pages
+        ]
+
+    def iter_pages(self) -> Iterator[Dict]:
+        """
+        Yield pages one at a time as {'page_number', 'source', 'text'} dicts.
+        Pages are extracted in small windows sized to the OCR parallelism, and each
+        rendered pixmap is released as soon as its page has been recognised.
+        """
+        doc = fitz.open(self.pdf_path)
+        pool = self.ocr_pool or get_default_pool()
+        window = pool.size if pool is not None else self.ocr_workers
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            
-            # Convert page to image
-            mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
-            
-            # OCR the image
-            try:
-                image = Image.open(io.BytesIO(img_data))
-                page_text = pytesseract.image_to_string(image, lang='eng')
-                all_text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
+        executor = None
+        if pool is None and self.ocr_workers > 1:
+            # One process pool for the whole document instead of one per window
+            executor = ProcessPoolExecutor(
+                max_workers=self.ocr_workers,
+                initializer=_init_ocr_worker,
+                initargs=(self.pdf_path, self.ocr_dpi, self.skip_blank_pages)
+            )
+        self._ocr_executor = executor
+        try:
+            for start in range(0, len(doc), window):
+                yield from self._extract_pages(doc, list(range(start, min(start + window, len(doc)))))
+        finally:
+            self._ocr_executor = None
+            if executor is not None:
+                executor.shutdown()
+            doc.close()
+
+    def iter_questions(self) -> Iterator[Dict]:
+        """
+        Stream questions while holding at most max_buffer_chars of page text.
+        Documents that fit in the buffer parse exactly like extract_questions. Larger
+        ones, such as compiled question banks, are flushed at the last page that starts
+        a new Group-A so each paper is parsed whole.
+        """
+        buffer: List[Dict] = []
+        buffered_chars = 0
+        # Layout rows of the buffered text pages, so Group-A is parsed like extract_questions does
+        layout_doc = fitz.open(self.pdf_path) if self.layout_mcqs else None
+        layout_lines: Dict[int, List[LayoutLine]] = {}
+        try:
+            for page in self.iter_pages():
+                buffer.append(page)
+                buffered_chars += len(page['text'])
+                if layout_doc is not None and page['source'] == 'text':
+                    layout_lines[page['page_number']] = list(
+                        iter_layout_lines(layout_doc[page['page_number'] - 1], page['page_number'])
+                    )
+                if buffered_chars <= self.max_buffer_chars:
+                    continue
+                
+                split = self._find_paper_boundary(buffer)
+                if split == 0:
+                    self.logger.warning(f"No paper boundary within {buffered_chars} buffered characters, flushing at page {page['page_number']}")
+                    split = len(buffer)
+                yield from self._parse_buffered_pages(buffer[:split], layout_lines)
+                buffer = buffer[split:]
+                buffered_chars = sum(len(p['text']) for p in buffer)
+        finally:
+            if layout_doc is not None:
+                layout_doc.close()
+        
+        if buffer:
+            yield from self._parse_buffered_pages(buffer, layout_lines)
+
+    def _parse_buffered_pages(self, pages: List[Dict], layout_lines: Dict[int, List[LayoutLine]]) -> List[Dict]:
+        """Parse a run of buffered pages, releasing their layout rows."""
+        lines = [line for page in pages for line in layout_lines.pop(page['page_number'], ())]
+        text = self._join_pages(pages)
+        if not text.strip():
+            return []
+        group_a_questions = self._parse_layout_lines(lines) if lines else None
+        return self._parse_text_for_questions(text, group_a_questions)
+
+    def _find_paper_boundary(self, pages: List[Dict]) -> int:
+        """Index of the last buffered page (after the first) that opens a new Group-A, or 0."""
+        for idx in range(len(pages) - 1, 0, -1):
+            if _GROUP_A_MARKER_RE.search(pages[idx]['text']):
+                return idx
+        return 0
+
+    def _extract_pages(self, doc, page_nums: Optional[List[int]] = None) -> List[Dict]:
+        """Take the text layer where it exists and OCR only the image-only pages."""
+        if page_nums is None:
+            page_nums = list(range(len(doc)))
+        pages = {}
+        ocr_page_nums = []
+        
+        for page_num in page_nums:
+            with self.timer.stage('text', page_num + 1):
+                page = doc[page_num]
+                page_text = page.get_text()
+                needs_ocr = self._needs_ocr(page, page_text)
+            if needs_ocr:
+                ocr_page_nums.append(page_num)
+                pages[page_num] = {'page_number': page_num + 1, 'source': 'ocr', 'text': ''}
+            else:
+                pages[page_num] = {'page_number': page_num + 1, 'source': 'text', 'text': page_text}
+        
+        if ocr_page_nums:
+            self.logger.info(f"{len(ocr_page_nums)} of {len(page_nums)} pages have no text layer, using OCR extraction...")
+            with self.timer.stage('ocr'):
+                ocr_results = self._ocr_pages(doc, ocr_page_nums)
+            for page_num, page_text, error in ocr_results:
+                if error is not None:
+                    self.logger.warning(f"OCR failed for page {page_num + 1}: {error}")
+                    pages[page_num]['source'] = 'ocr_failed'
+                    continue
+                if page_num in self._skipped_pages:
+                    pages[page_num]['source'] = 'skipped'
+                    pages[page_num]['skip_reason'] = self._skipped_pages[page_num]
+                    self.logger.info(f"Skipped OCR for page {page_num + 1}: {self._skipped_pages[page_num]}")
+                    continue
+                pages[page_num]['text'] = page_text
                 self.logger.info(f"OCR extracted {len(page_text)} characters from page {page_num + 1}")
+        
+        return [pages[page_num] for page_num in page_nums]
+
+    def _needs_ocr(self, page, page_text: str) -> bool:
+        """Decide whether a page is a scan that has to go through OCR."""
+        stripped = page_text.strip()
+        if not stripped:
+            return True
+        # A short text layer on top of an image is usually a stamped header or page number
+        return len(stripped) < self.MIN_TEXT_CHARS and bool(page.get_images(full=False))
+
+    def _join_pages(self, pages: List[Dict]) -> str:
+        """Join per-page text into the single document string the parser expects."""
+        parts = []
+        for page in pages:
+            if page['source'] == 'ocr':
+                parts.append(f"\n--- Page {page['page_number']} ---\n{page['text']}\n")
+            elif page['source'] == 'text' and page['text'].strip():
+                parts.append(page['text'])
+        return "".join(parts)
+
+    def _ocr_pages(self, doc, page_nums: List[int]) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """OCR the given pages on the persistent pool, or in parallel when more than one worker is configured."""
+        self._skipped_pages = {}
+        pool = self.ocr_pool or get_default_pool()
+        if pool is not None:
+            return self._ocr_pages_pooled(doc, page_nums, pool)
+        if self.ocr_workers > 1 and len(page_nums) > 1:
+            return self._ocr_pages_parallel(page_nums)
+        return self._ocr_pages_serial(doc, page_nums)
+
+    def _ocr_pages_serial(self, doc, page_nums: List[int]) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """OCR pages one after another in this process."""
+        results = []
+        for page_num in page_nums:
+            try:
+                with self.timer.stage('ocr_page', page_num + 1):
+                    page_text, skip_reason = _ocr_page(doc[page_num], self.ocr_dpi, self.skip_blank_pages)
+                if skip_reason is not None:
+                    self._skipped_pages[page_num] = skip_reason
+                results.append((page_num, page_text, None))
             except Exception as e:
-                self.logger.warning(f"OCR failed for page {page_num + 1}: {e}")
+                results.append((page_num, None, str(e)))
+        return results
+
+    def _ocr_pages_pooled(
+        self,
+        doc,
+        page_nums: List[int],
+        pool: OCRWorkerPool
+    ) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """Render pages here and recognise them on the persistent OCR workers."""
+        # Keep rendering at most a couple of pages ahead of the workers
+        in_flight = threading.BoundedSemaphore(pool.size * 2)
+        pending = []
+        
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            for page_num in page_nums:
+                in_flight.acquire()
+                try:
+                    with self.timer.stage('render_page', page_num + 1):
+                        pix = _render_page_for_ocr(doc[page_num], self.ocr_dpi)
+                        skip_reason = None
+                        if not self.skip_blank_pages:
+                            job = (pix.width, pix.height, pix.stride, pix.samples)
+                        else:
+                            pixels, skip_reason = _content_pixels(pix)
+                            if pixels is not None:
+                                job = (pixels.shape[1], pixels.shape[0], pixels.shape[1], pixels.tobytes())
+                                del pixels
+                        del pix
+                except Exception as e:
+                    in_flight.release()
+                    pending.append((page_num, None, str(e)))
+                    continue
+                if skip_reason is not None:
+                    in_flight.release()
+                    self._skipped_pages[page_num] = skip_reason
+                    pending.append((page_num, None, None))
+                    continue
+                future = executor.submit(self._timed_pool_ocr, pool, page_num, job)
+                future.add_done_callback(lambda _: in_flight.release())
+                pending.append((page_num, future, None))
         
-        return all_text
+        results = []
+        for page_num, future, error in pending:
+            if future is None:
+                results.append((page_num, '' if error is None else None, error))
+                continue
+            try:
+                results.append((page_num, future.result(), None))
+            except Exception as e:
+                results.append((page_num, None, str(e)))
+        return results
 
-    def _parse_text_for_questions(self, text: str) -> List[Dict]:
-        """Parse questions from extracted text according to group structure."""
-        questions = []
+    def _timed_pool_ocr(self, pool: OCRWorkerPool, page_num: int, job: Tuple) -> str:
+        """Send one page to the pool and record how long the worker round trip took."""
+        wall_start = time.perf_counter()
+        try:
+            return pool.ocr(*job)
+        finally:
+            # The CPU time is spent in the worker process, so only wall time is known here
+            self.timer.record('ocr_page', time.perf_counter() - wall_start, 0.0, page_num + 1)
+
+    def _ocr_pages_parallel(self, page_nums: List[int]) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """OCR pages across a process pool, returning results in page order."""
+        if self._ocr_executor is not None:
+            return self._collect_worker_results(self._ocr_executor.map(_ocr_page_worker, page_nums))
+        
+        workers = min(self.ocr_workers, len(page_nums))
+        self.logger.info(f"Running OCR on {len(page_nums)} pages with {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_ocr_worker,
+            initargs=(self.pdf_path, self.ocr_dpi, self.skip_blank_pages)
+        ) as executor:
+            # map() yields results in submission order regardless of completion order
+            return self._collect_worker_results(executor.map(_ocr_page_worker, page_nums))
+
+    def _collect_worker_results(self, worker_results) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """Record the timings measured in worker processes and drop them from the results."""
+        results = []
+        for page_num, page_text, error, skip_reason, wall, cpu in worker_results:
+            self.timer.record('ocr_page', wall, cpu, page_num + 1)
+            if skip_reason is not None:
+                self._skipped_pages[page_num] = skip_reason
+            results.append((page_num, page_text, error))
+        return results
+
+    def _parse_group_a_from_layout(self, doc) -> Optional[List[Dict]]:
+        """Parse Group-A MCQs from the geometry of text-layer pages, or None if that finds nothing."""
+        # Every row is kept, not only those this parser reads, so reparse can serve later layout rules
+        self.layout_lines = [
+            line
+            for page in self.pages if page['source'] == 'text'
+            for line in iter_layout_lines(doc[page['page_number'] - 1], page['page_number'])
+        ]
+        return self._parse_layout_lines(self.layout_lines)
+
+    def _parse_layout_lines(self, lines) -> Optional[List[Dict]]:
+        try:
+            questions = parse_group_a_layout(lines)
+        except Exception as e:
+            self.logger.warning(f"Layout parsing failed, falling back to text strategies: {e}")
+            return None
+        if not questions:
+            return None
+        self.logger.info(f"Parsed {len(questions)} Group-A questions from page layout")
+        return questions
+
+    def iter_question_groups(self) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Yield (group, questions) for each group as soon as it can be parsed.
+        A group is complete once the page carrying the next group's marker has been
+        extracted, so Group-A can be answered while later pages are still being OCR'd.
+        Groups are parsed from the text available at that point; the last ones are
+        parsed from the whole document once every page is in.
+        """
+        emitted = set()
+        pages: List[Dict] = []
+        layout_doc = fitz.open(self.pdf_path) if self.layout_mcqs else None
+        layout_lines: List[LayoutLine] = []
+        try:
+            for page in self.iter_pages():
+                pages.append(page)
+                if layout_doc is not None and page['source'] == 'text' and 'Group-A' not in emitted:
+                    layout_lines.extend(iter_layout_lines(layout_doc[page['page_number'] - 1], page['page_number']))
+                # Only a new section marker can complete a group
+                if not _SECTION_MARKER_RE.search(page['text']):
+                    continue
+                group_a_questions = self._parse_layout_lines(layout_lines) if layout_lines else None
+                for group, questions in self._iter_group_questions(self._join_pages(pages), group_a_questions, complete_only=True):
+                    if group not in emitted:
+                        emitted.add(group)
+                        yield group, questions
+        finally:
+            if layout_doc is not None:
+                layout_doc.close()
         
+        text = self._join_pages(pages)
+        if not text.strip():
+            return
+        group_a_questions = self._parse_layout_lines(layout_lines) if layout_lines else None
+        for group, questions in self._iter_group_questions(text, group_a_questions):
+            if group not in emitted:
+                yield group, questions
+
+    def _parse_text_for_questions(self, text: str, group_a_questions: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Parse questions from extracted text according to group structure.
+        Group-A questions already parsed from page layout are used instead of the text strategies.
+        """
+        questions = []
+        for _, group_questions in self._iter_group_questions(text, group_a_questions):
+            questions.extend(group_questions)
+        return questions
+
+    def _iter_group_questions(
+        self,
+        text: str,
+        group_a_questions: Optional[List[Dict]] = None,
+        complete_only: bool = False
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Yield (group, questions) in paper order. With complete_only, stop at the first
+        group whose end marker is not in the text yet.
+        """
         # Clean the text first - remove unwanted content
-        cleaned_text = self._clean_pdf_text(text)
+        with self.timer.stage('clean'):
+            cleaned_text = self._clean_pdf_text(text)
         
-        # Split text into sections by groups
-        group_a_section = self._extract_section(cleaned_text, "Group-A", "Group-B")
-        group_b_section = self._extract_section(cleaned_text, "Group-B", "Group-C")
-        group_c_section = self._extract_section(cleaned_text, "Group-C", "END OF PAPER")
+        # Locate all group sections in one pass; parsers work on offsets into cleaned_text
+        with self.timer.stage('sections'):
+            sections = self._index_sections(cleaned_text)
+        group_a, group_b, group_c = sections['Group-A'], sections['Group-B'], sections['Group-C']
         
         # Parse each group
-        if group_a_section:
-            questions.extend(self._parse_group_a_mcqs(group_a_section))
-        
-        if group_b_section:
-            questions.extend(self._parse_group_b_short_answer(group_b_section))
+        if complete_only and group_a.end_variant is None:
+            return
+        if group_a_questions:
+            yield 'Group-A', group_a_questions
+        elif _NON_SPACE_RE.search(cleaned_text, group_a.start, group_a.end):
+            with self.timer.stage('group_a'):
+                questions = self._parse_group_a_mcqs(cleaned_text[group_a.start:group_a.end].strip())
+            yield 'Group-A', questions
+        else:
+            yield 'Group-A', []
         
-        if group_c_section:
-            questions.extend(self._parse_group_c_long_answer(group_c_section))
+        if complete_only and group_b.end_variant is None:
+            return
+        questions = []
+        if _NON_SPACE_RE.search(cleaned_text, group_b.start, group_b.end):
+            with self.timer.stage('group_b'):
+                questions = self._parse_group_b_short_answer(cleaned_text, group_b.start, group_b.end)
+        yield 'Group-B', questions
         
-        return questions
+        if complete_only and group_c.end_variant is None:
+            return
+        questions = []
+        if _NON_SPACE_RE.search(cleaned_text, group_c.start, group_c.end):
+            with self.timer.stage('group_c'):
+                questions = self._parse_group_c_long_answer(cleaned_text, group_c.start, group_c.end)
+        yield 'Group-C', questions
 
     def _clean_pdf_text(self, text: str) -> str:
         """Clean PDF text by removing unwanted content."""
-        # List of patterns to remove
-        unwanted_patterns = [
-            r'Group-A\s*\(Very Short Answer Type Question\)',
-            r'Group-B\s*\([^)]+\)',
-            r'Group-C\s*\([^)]+\)',
-            r'Answer any ten of the following\s*:?',
-            r'Answer any \w+ of the following\s*:?',
-            r'\[\s*\d+\s*x\s*\d+\s*=\s*\d+\s*\]',
-            r'End of paper',
-            r'END OF PAPER',
-            r'Time\s*:\s*\d+\s*hours?',
-            r'Marks?\s*:\s*\d+',
-            r'Maximum Marks?\s*:\s*\d+',
-            r'Full Marks?\s*:\s*\d+',
-            r'Instructions?\s*:',
-            r'Note\s*:',
-            r'Attempt any \w+ questions?',
-            r'All questions? are compulsory',
-            r'Page\s*\d+\s*of\s*\d+',
-            r'Question Paper Code\s*:',
-            r'Roll No\.?\s*:',
-            r'Name\s*:',
-            r'Subject\s*:',
-            r'Course\s*:',
-            r'Semester\s*:',
-            r'Date\s*:',
-            r'Duration\s*:'
-        ]
-        
-        cleaned_text = text
-        for pattern in unwanted_patterns:
-            cleaned_text = re.sub(pattern, '', cleaned_text, flags=re.IGNORECASE)
+        cleaned_text = _DOCUMENT_BOILERPLATE_STRIPPER.strip(text)
         
         # Remove extra whitespace
-        cleaned_text = re.sub(r'\n\s*\n', '\n\n', cleaned_text)
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+        cleaned_text = _collapse_whitespace(cleaned_text)
         
         return cleaned_text
 
-    def _extract_section(self, text: str, start_marker: str, end_marker: str) -> str:
-        """Extract text between two markers with improved detection."""
-        # More flexible pattern matching for group markers
-        start_patterns = [
-            start_marker,
-            start_marker.replace('-', ''),
-            start_marker.replace('-', ' '),
-            start_marker.upper(),
-            start_marker.lower(),
-            r'Group\s*-?\s*A.*?Question\)'  # Special pattern for "Group-A (Very Short Answer Type Question)"
-        ]
+    def _index_sections(self, text: str) -> Dict[str, SectionRange]:
+        """Locate every group section with a single scan for all marker spellings."""
+        occurrences: Dict[str, List[int]] = {}
+        for match in _SECTION_MARKER_RE.finditer(text):
+            occurrences.setdefault(match.group(), []).append(match.start())
         
+        sections = {}
+        for start_marker, end_marker in _SECTION_BOUNDARIES:
+            section = self._locate_section(text, occurrences, start_marker, end_marker)
+            sections[start_marker] = section
+            self.logger.debug(
+                f"{start_marker} section: {section.end - section.start} characters "
+                f"(start marker {section.start_variant!r}, end marker {section.end_variant!r})"
+            )
+        
+        # Record which spellings matched so layout drift across universities shows up
+        self.section_markers = {
+            marker: {'start': section.start_variant, 'end': section.end_variant}
+            for marker, section in sections.items()
+        }
+        self.logger.info(f"Section markers matched: {self.section_markers}")
+        return sections
+
+    def _locate_section(
+        self,
+        text: str,
+        occurrences: Dict[str, List[int]],
+        start_marker: str,
+        end_marker: str
+    ) -> SectionRange:
+        """Resolve the offsets of one section from the indexed marker positions."""
         start_pos = -1
-        for pattern in start_patterns:
-            if start_marker == "Group-A" and pattern == r'Group\s*-?\s*A.*?Question\)':
-                # Use regex search for this pattern
-                match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-                if match:
-                    start_pos = match.start()
-                    break
-            else:
-                pos = text.find(pattern)
-                if pos != -1:
-                    start_pos = pos
-                    break
+        start_variant = None
+        for variant in _SECTION_MARKER_VARIANTS[start_marker]:
+            if variant in occurrences:
+                start_pos = occurrences[variant][0]
+                start_variant = variant
+                break
+        
+        if start_pos == -1 and start_marker == "Group-A":
+            match = _GROUP_A_HEADER_RE.search(text)
+            if match:
+                start_pos = match.start()
+                start_variant = _GROUP_A_HEADER_RE.pattern
         
         if start_pos == -1:
             self.logger.debug(f"Could not find start marker '{start_marker}' in text")
-            return text  # Return full text if no start marker found
-        
-        # Find the actual start of questions (after the group header and instructions)
-        section_start = text[start_pos:]
+            return SectionRange(0, len(text), None, None)  # Use full text if no start marker found
         
         # Skip past common instruction patterns to get to actual questions
-        question_start_patterns = [
-            r'(?:Answer any \w+ of the following\s*:?)',
-            r'(?:\[\s*\d+\s*x\s*\d+\s*=\s*\d+\s*\])',
-            r'(?:Very Short Answer Type Question\s*)',
-            r'(?:Short Answer Type Question\s*)',
-            r'(?:Long Answer Type Question\s*)'
-        ]
-        
-        for pattern in question_start_patterns:
-            match = re.search(pattern, section_start, re.IGNORECASE)
+        section_start = start_pos
+        for pattern in _SECTION_INTRO_PATTERNS:
+            match = pattern.search(text, section_start)
             if match:
-                section_start = section_start[match.end():]
-        
-        # Now find the end marker
-        end_patterns = [
-            end_marker,
-            end_marker.replace('-', ''),
-            end_marker.replace('-', ' '),
-            end_marker.upper(),
-            end_marker.lower()
-        ]
+                section_start = match.end()
         
-        end_pos = -1
-        for pattern in end_patterns:
-            pos = section_start.find(pattern)
-            if pos != -1:
-                end_pos = pos
-                break
-        
-        if end_pos == -1:
-            result = section_start.strip()
-        else:
-            result = section_start[:end_pos].strip()
+        # Now find the first end marker after the questions start
+        for variant in _SECTION_MARKER_VARIANTS[end_marker]:
+            positions = occurrences.get(variant)
+            if not positions:
+                continue
+            idx = bisect_left(positions, section_start)
+            if idx < len(positions):
+                return SectionRange(section_start, positions[idx], start_variant, variant)
         
-        self.logger.debug(f"Extracted {start_marker} section: {len(result)} characters")
-        return result
+        return SectionRange(section_start, len(text), start_variant, None)
 
     def _parse_group_a_mcqs(self, section: str) -> List[Dict]:
         """Parse Group A MCQs from actual PDF text with improved cleaning and flexible parsing."""
@@ -226,47 +932,28 @@ class PDFExtractor:
         self.logger.debug(f"Parsing Group-A section ({len(section)} chars):")
         self.logger.debug(f"First 1000 chars: {section[:1000]}")
         
-        # Additional cleaning specific to Group A
-        cleaned_section = section
-        
-        # Remove any remaining unwanted text patterns
-        unwanted_in_section = [
-            r'Group\s*-?\s*A.*?Question\)',
-            r'Answer any \w+ of the following\s*:?',
-            r'\[\s*\d+\s*x\s*\d+\s*=\s*\d+\s*\]',
-            r'Choose the correct option',
-            r'Select the correct answer',
-            r'Tick the correct option',
-            r'The Figures in the margin indicate full marks',
-            r'Candidate are required to give their answers',
-            r'Time Allotted\s*:\s*\d+\s*Hours',
-            r'Full Marks\s*:\s*\d+',
-            r'Paper Code\s*:',
-            r'UPID\s*:',
-            r'MAULANA ABUL KALAM AZAD UNIVERSITY',
-            r'CS/B\.TECH',
-            r'Computer Networks',
-            r'---\s*Page\s*\d+\s*---'
-        ]
-        
-        for pattern in unwanted_in_section:
-            cleaned_section = re.sub(pattern, '', cleaned_section, flags=re.IGNORECASE | re.DOTALL)
+        # Remove any remaining unwanted text patterns specific to Group A
+        with self.timer.stage('group_a_clean'):
+            cleaned_section = _GROUP_A_BOILERPLATE_STRIPPER.strip(section)
         
         self.logger.debug(f"After cleaning ({len(cleaned_section)} chars):")
         self.logger.debug(f"First 500 chars: {cleaned_section[:500]}")
         
         # Try multiple parsing strategies
-        questions = self._parse_strategy_numbered(cleaned_section)
+        with self.timer.stage('group_a_numbered'):
+            questions = self._parse_strategy_numbered(cleaned_section)
         
         # If that didn't work, try parsing by sentences/paragraphs
         if not questions:
             self.logger.debug("Numbered strategy failed, trying sentence-based parsing...")
-            questions = self._parse_strategy_sentences(cleaned_section)
+            with self.timer.stage('group_a_sentences'):
+                questions = self._parse_strategy_sentences(cleaned_section)
         
         # If still no questions, try a more aggressive line-by-line approach
         if not questions:
             self.logger.debug("Sentence strategy failed, trying line-by-line parsing...")
-            questions = self._parse_strategy_lines(cleaned_section)
+            with self.timer.stage('group_a_lines'):
+                questions = self._parse_strategy_lines(cleaned_section)
         
         self.logger.info(f"Successfully parsed {len(questions)} questions from Group-A")
         return questions
@@ -286,16 +973,9 @@ class PDFExtractor:
                 continue
             
             # Look for question numbers with various formats
-            question_patterns = [
-                r'^(\d+)\.\s*(.+)',     # 1. Question text
-                r'^(\d+)\)\s*(.+)',     # 1) Question text
-                r'^\((\d+)\)\s*(.+)',   # (1) Question text
-                r'^Q\.?\s*(\d+)\s*[.:]?\s*(.+)'  # Q.1 Question text or Q1: 
-            ]
-            
             found_question = False
-            for pattern in question_patterns:
-                match = re.match(pattern, line, re.IGNORECASE)
+            for pattern in _QUESTION_LINE_PATTERNS:
+                match = pattern.match(line)
                 if match:
                     # Save previous question if we have one
                     if current_question and question_count < 10:
@@ -323,17 +1003,10 @@ class PDFExtractor:
                 continue
             
             # Look for options with various formats
-            option_patterns = [
-                r'^[\(\)]*[a-dA-D][\)\(]\s*(.+)',  # a) text or (a) text
-                r'^[a-dA-D][.:\-]\s*(.+)',        # a. text or a: text
-                r'^\([a-dA-D]\)\s*(.+)',          # (a) text
-                r'^[a-dA-D]\s+(.+)'               # a text (space separated)
-            ]
-            
             if in_question:
                 found_option = False
-                for pattern in option_patterns:
-                    match = re.match(pattern, line, re.IGNORECASE)
+                for pattern in _OPTION_LINE_PATTERNS:
+                    match = pattern.match(line)
                     if match and len(match.group(1).strip()) > 2:
                         current_options.append(line)
                         self.logger.debug(f"Found option: {line}")
@@ -343,7 +1016,7 @@ class PDFExtractor:
                 # If not an option and we're in a question, add to question text
                 if not found_option and len(line) > 5:
                     # Don't add if it looks like a new question
-                    if not any(re.match(p, line, re.IGNORECASE) for p in question_patterns):
+                    if not any(p.match(line) for p in _QUESTION_LINE_PATTERNS):
                         current_question += " " + line
         
         # Don't forget the last question
@@ -400,16 +1073,15 @@ class PDFExtractor:
         self.logger.info(f"Successfully parsed {len(questions)} questions from Group-A")
         return questions
 
-    def _parse_group_b_short_answer(self, section: str) -> List[Dict]:
-        """Parse Group B short answer questions from actual PDF text."""
+    def _parse_group_b_short_answer(self, section: str, start: int = 0, end: Optional[int] = None) -> List[Dict]:
+        """Parse Group B short answer questions from section[start:end] of the PDF text."""
         questions = []
         
         # Parse actual questions from the PDF text
-        question_pattern = r'(?:Question\s*)?Q?(\d+)[\:\.]?\s*(.+?)(?=(?:Question\s*)?Q?\d+[\:\.]|$)'
-        matches = re.findall(question_pattern, section, re.DOTALL | re.IGNORECASE)
+        matches = _NUMBERED_QUESTION_RE.findall(section, start, len(section) if end is None else end)
         
         for i, (q_num, question_text) in enumerate(matches[:5], 1):  # Limit to 5 questions
-            question_text = re.sub(r'\s+', ' ', question_text.strip())
+            question_text = ' '.join(question_text.split())
             
             if question_text:
                 questions.append({
@@ -422,16 +1094,15 @@ class PDFExtractor:
         
         return questions
 
-    def _parse_group_c_long_answer(self, section: str) -> List[Dict]:
-        """Parse Group C long answer questions from actual PDF text."""
+    def _parse_group_c_long_answer(self, section: str, start: int = 0, end: Optional[int] = None) -> List[Dict]:
+        """Parse Group C long answer questions from section[start:end] of the PDF text."""
         questions = []
         
         # Parse actual questions from the PDF text
-        question_pattern = r'(?:Question\s*)?Q?(\d+)[\:\.]?\s*(.+?)(?=(?:Question\s*)?Q?\d+[\:\.]|$)'
-        matches = re.findall(question_pattern, section, re.DOTALL | re.IGNORECASE)
+        matches = _NUMBERED_QUESTION_RE.findall(section, start, len(section) if end is None else end)
         
         for i, (q_num, question_text) in enumerate(matches[:5], 1):  # Limit to 5 questions
-            question_text = re.sub(r'\s+', ' ', question_text.strip())
+            question_text = ' '.join(question_text.split())
             
             if question_text:
                 questions.append({
@@ -471,6 +1142,12 @@ class PDFExtractor:
                 writer.writerow(question_copy)
         
         self.logger.info(f"Extracted {len(questions)} questions to {output_path}")
+
+    def extract_to_jsonl(self, output_path: str) -> None:
+        """Extract questions and save them as JSONL, keeping options as lists."""
+        questions = self.extract_question_batch()
+        questions.write_jsonl(output_path)
+        self.logger.info(f"Extracted {len(questions)} questions to {output_path}")
     
     def __enter__(self):
         return self
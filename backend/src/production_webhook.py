@@ -28,6 +28,7 @@ except ImportError:
     from flask import Flask, request, jsonify, abort
     from flask_cors import CORS
 
+from question_model import QuestionBatch
 from supabase_integration import EduPapersProcessor
 
 # Configure logging
@@ -177,6 +178,11 @@ class EduPapersWebhookAPI:
                 
                 status = self.processing_status[processing_id].copy()
             
+            # Completed results keep their questions as a QuestionBatch until they are served
+            result = status.get('result')
+            if result and isinstance(result.get('questions'), QuestionBatch):
+                status['result'] = {**result, 'questions': result['questions'].to_dicts()}
+            
             return jsonify({
                 'success': True,
                 'processing_id': processing_id,
@@ -0,0 +1,187 @@
+"""
+Shared question model for the extraction, storage and answering pipeline.
+Question is a slotted record with one canonical set of field names, and
+QuestionBatch keeps many questions column by column so bulk jobs do not
+carry a dict per question. Both convert to the parser's dict shape, to
+Supabase records and to JSON.
+"""
+
+import sys
+import json
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Alternative key spellings found in older code paths, mapped to Question fields
+_KEY_ALIASES = {
+    'number': 'question_number',
+    'question': 'text',
+    'question_text': 'text',
+    'group_name': 'group',
+    'question_type': 'type',
+    'difficulty_level': 'difficulty',
+}
+
+# Question field -> column name in the Supabase questions table
+_RECORD_FIELDS = {
+    'group': 'group_name',
+    'question_number': 'question_number',
+    'type': 'question_type',
+    'text': 'question_text',
+    'options': 'options',
+    'correct_answer': 'correct_answer',
+    'explanation': 'explanation',
+    'difficulty': 'difficulty_level',
+    'marks': 'marks',
+}
+
+# Fields the parser always emits; the rest are only included in dicts when set
+_PARSER_FIELDS = ('group', 'question_number', 'type', 'text', 'options')
+
+
+@dataclass(slots=True)
+class Question:
+    """One extracted question."""
+    group: str = ''
+    question_number: int = 1
+    type: str = 'MCQ'
+    text: str = ''
+    options: Tuple[str, ...] = ()
+    correct_answer: str = ''
+    explanation: str = ''
+    difficulty: str = 'Medium'
+    marks: int = 1
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_number: int = 1) -> "Question":
+        """Build a Question from a parser dict, a database row or a legacy dict with aliased keys."""
+        values = {}
+        for key, value in data.items():
+            name = _KEY_ALIASES.get(key, key)
+            if name in _FIELD_NAMES and name not in values:
+                values[name] = value
+        values.setdefault('question_number', default_number)
+        options = values.get('options')
+        if isinstance(options, str):
+            # Database rows keep options as a JSON string
+            options = json.loads(options)
+        values['options'] = tuple(options or ())
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dict shape produced by PDFExtractor."""
+        data = {
+            'group': self.group,
+            'question_number': self.question_number,
+            'type': self.type,
+            'text': self.text,
+            'options': list(self.options),
+        }
+        for name in _FIELD_NAMES:
+            if name not in _PARSER_FIELDS and getattr(self, name) != _FIELD_DEFAULTS[name]:
+                data[name] = getattr(self, name)
+        return data
+
+    def prompt_text(self) -> str:
+        """Format the question the way it is shown to the answering model."""
+        options = '\nOptions:\n' + '\n'.join(self.options) if self.options else ''
+        return f"{self.group}\nQuestion {self.question_number}:\n{self.text}{options}"
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(Question))
+_FIELD_DEFAULTS = {f.name: f.default for f in fields(Question)}
+
+
+class QuestionBatch:
+    """
+    Column-oriented collection of questions.
+    Each field is one list, repeated group and type labels share a single
+    string, and rows are materialised as Question objects only when iterated.
+    """
+
+    __slots__ = ('_columns',)
+
+    def __init__(self, questions: Iterable[Question] = ()):
+        self._columns: Dict[str, List] = {name: [] for name in _FIELD_NAMES}
+        self.extend(questions)
+
+    @classmethod
+    def from_dicts(cls, questions: Iterable[Dict[str, Any]]) -> "QuestionBatch":
+        batch = cls()
+        for idx, question in enumerate(questions):
+            batch.append(Question.from_dict(question, default_number=idx + 1))
+        return batch
+
+    @classmethod
+    def coerce(cls, questions: Union["QuestionBatch", Iterable[Union[Question, Dict[str, Any]]]]) -> "QuestionBatch":
+        """Return questions as a batch, accepting a batch, Question objects or question dicts."""
+        if isinstance(questions, cls):
+            return questions
+        batch = cls()
+        for idx, question in enumerate(questions):
+            if not isinstance(question, Question):
+                question = Question.from_dict(question, default_number=idx + 1)
+            batch.append(question)
+        return batch
+
+    def append(self, question: Question) -> None:
+        columns = self._columns
+        for name in _FIELD_NAMES:
+            value = getattr(question, name)
+            if name in ('group', 'type', 'difficulty'):
+                value = sys.intern(value)
+            columns[name].append(value)
+
+    def extend(self, questions: Iterable[Question]) -> None:
+        for question in questions:
+            self.append(question)
+
+    def column(self, name: str) -> List:
+        """Return the list holding one field for every question (not a copy)."""
+        return self._columns[_KEY_ALIASES.get(name, name)]
+
+    def __len__(self) -> int:
+        return len(self._columns['text'])
+
+    def __getitem__(self, index: int) -> Question:
+        return Question(*(self._columns[name][index] for name in _FIELD_NAMES))
+
+    def __iter__(self) -> Iterator[Question]:
+        for row in zip(*(self._columns[name] for name in _FIELD_NAMES)):
+            yield Question(*row)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return the questions in the dict shape produced by PDFExtractor."""
+        return [question.to_dict() for question in self]
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dicts(), ensure_ascii=False, **kwargs)
+
+    def write_jsonl(self, path: str) -> None:
+        """Spill the batch to disk, one question per line with options kept as a list."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for question in self:
+                f.write(json.dumps(question.to_dict(), ensure_ascii=False))
+                f.write('\n')
+
+    @classmethod
+    def read_jsonl(cls, path: str) -> "QuestionBatch":
+        """Load a batch spilled with write_jsonl, one line at a time."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dicts(json.loads(line) for line in f if line.strip())
+
+    def to_records(self, common: Dict[str, Any], start: int = 0, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Build Supabase rows for questions[start:end]. Fields shared by every row
+        (paper metadata, timestamps) are passed once in common.
+        """
+        end = len(self) if end is None else min(end, len(self))
+        columns = [(record_name, self._columns[name]) for name, record_name in _RECORD_FIELDS.items()]
+        records = []
+        for idx in range(start, end):
+            record = dict(common)
+            for record_name, column in columns:
+                record[record_name] = column[idx]
+            options = record['options']
+            record['options'] = json.dumps(list(options)) if options else None
+            records.append(record)
+        return records
@@ -0,0 +1,80 @@
+"""
+Token-bucket rate limiting for LLM requests.
+One bucket meters requests per minute and another tokens per minute; callers
+block in acquire() until both have capacity, so concurrent workers share the
+provider quota instead of each tripping 429s.
+"""
+
+import time
+import threading
+from typing import Optional
+
+from resilience import DeadlineExceededError
+
+
+class TokenBucket:
+    """A bucket refilled continuously at rate_per_min up to a capacity of one minute's worth."""
+
+    def __init__(self, rate_per_min: float):
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(rate_per_min)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount can be taken; amounts above capacity wait for a full bucket."""
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.level
+        return max(0.0, needed / self.rate)
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+
+class RateLimiter:
+    """
+    Requests/min and tokens/min limits shared by every thread using one client.
+    A limit of 0 or None disables that bucket.
+    """
+
+    def __init__(self, requests_per_min: Optional[float] = None, tokens_per_min: Optional[float] = None):
+        self._requests = TokenBucket(requests_per_min) if requests_per_min else None
+        self._tokens = TokenBucket(tokens_per_min) if tokens_per_min else None
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0, deadline: Optional[float] = None) -> float:
+        """
+        Block until one request of the given token estimate may be sent. Returns
+        seconds waited; raises DeadlineExceededError if that is not before the deadline.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = 0.0
+                if self._requests is not None:
+                    delay = max(delay, self._requests.wait_time(1, now))
+                if self._tokens is not None:
+                    delay = max(delay, self._tokens.wait_time(tokens, now))
+                if delay <= 0:
+                    if self._requests is not None:
+                        self._requests.take(1)
+                    if self._tokens is not None:
+                        self._tokens.take(tokens)
+                    return waited
+                if deadline is not None and now + delay >= deadline:
+                    raise DeadlineExceededError(f"Rate limit would hold the request past its deadline ({delay:.1f}s)")
+            time.sleep(delay)
+            waited += delay
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the real usage of a request is known."""
+        if self._tokens is None:
+            return
+        with self._lock:
+            # Overspend drives the level negative, which delays the next requests accordingly
+            self._tokens.take(actual_tokens - estimated_tokens)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Re-run question parsing over the stored page text of every paper.
+Only PDFExtractor._parse_text_for_questions (and the Group-A layout parser)
+run; no PDF is downloaded, opened or OCR'd. Papers are processed in
+parallel and every paper whose questions changed is written to a JSONL diff.
+
+Usage:
+    python reparse.py [--store-dir DIR] [--workers N] [--diff-output changes.jsonl] [--write]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from pdf_extractor import EXTRACTOR_VERSION, PDFExtractor
+from page_store import PageTextStore
+
+logger = logging.getLogger(__name__)
+
+
+def _question_key(question: Dict) -> Tuple[str, int]:
+    return question.get('group', ''), question.get('question_number', 0)
+
+
+def diff_questions(before: List[Dict], after: List[Dict]) -> Dict:
+    """Compare two question lists by (group, question_number)."""
+    old = {_question_key(q): q for q in before}
+    new = {_question_key(q): q for q in after}
+    return {
+        'added': [new[key] for key in new if key not in old],
+        'removed': [old[key] for key in old if key not in new],
+        'changed': [
+            {'group': key[0], 'question_number': key[1], 'before': old[key], 'after': new[key]}
+            for key in old if key in new and old[key] != new[key]
+        ]
+    }
+
+
+def _reparse_entry(args: Tuple[str, str, bool]) -> Dict:
+    """Re-parse one stored paper inside a worker process and return its diff."""
+    store_dir, path, write = args
+    store = PageTextStore(store_dir)
+    entry = store.load(path)
+    if entry is None:
+        return {'path': path, 'error': 'unreadable entry'}
+
+    extractor = PDFExtractor(entry['source'], cache=None, page_store=store)
+    try:
+        questions = extractor.parse_stored_pages(entry['pages'], entry.get('layout_lines'))
+    except Exception as e:
+        return {'pdf_hash': entry['pdf_hash'], 'source': entry['source'], 'error': str(e)}
+
+    diff = diff_questions(entry.get('questions', []), questions)
+    changed = any(diff.values())
+    if write and (changed or entry.get('extractor_version') != EXTRACTOR_VERSION):
+        store.update_questions(entry['pdf_hash'], questions, EXTRACTOR_VERSION)
+    return {
+        'pdf_hash': entry['pdf_hash'],
+        'source': entry['source'],
+        'stored_version': entry.get('extractor_version'),
+        'questions_before': len(entry.get('questions', [])),
+        'questions_after': len(questions),
+        'changed': changed,
+        **diff
+    }
+
+
+def reparse_corpus(store: PageTextStore, workers: int, diff_output: str = None, write: bool = False) -> Dict:
+    """Re-parse every stored paper in parallel, write the diff and return a summary."""
+    paths = store.paths()
+    start = time.perf_counter()
+    summary = {'papers': len(paths), 'changed': 0, 'unchanged': 0, 'errors': 0, 'questions_before': 0, 'questions_after': 0}
+
+    diff_file = open(diff_output, 'w', encoding='utf-8') if diff_output else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = [(store.store_dir, path, write) for path in paths]
+            # map() keeps the diff in store order; chunks amortise the per-task IPC on large corpora
+            for result in executor.map(_reparse_entry, jobs, chunksize=max(1, len(jobs) // (workers * 8))):
+                if 'error' in result:
+                    summary['errors'] += 1
+                    logger.warning(f"Could not re-parse {result.get('source', result.get('path'))}: {result['error']}")
+                    continue
+                summary['questions_before'] += result['questions_before']
+                summary['questions_after'] += result['questions_after']
+                if not result['changed']:
+                    summary['unchanged'] += 1
+                    continue
+                summary['changed'] += 1
+                if diff_file is not None:
+                    diff_file.write(json.dumps(result, ensure_ascii=False) + '\n')
+    finally:
+        if diff_file is not None:
+            diff_file.close()
+
+    summary['seconds'] = round(time.perf_counter() - start, 2)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-parse stored page text without re-extracting PDFs')
+    parser.add_argument('--store-dir', default=os.getenv('PAGE_TEXT_STORE_DIR'), help='Page text store (defaults to PAGE_TEXT_STORE_DIR)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parser processes')
+    parser.add_argument('--diff-output', default='reparse_diff.jsonl', help='JSONL file for papers whose questions changed')
+    parser.add_argument('--write', action='store_true', help='Save the re-parsed questions back to the store')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Per-paper parser logging would drown the summary
+    logging.getLogger('pdf_extractor').setLevel(logging.WARNING)
+
+    if not args.store_dir or not os.path.isdir(args.store_dir):
+        print("Error: no page text store found, set PAGE_TEXT_STORE_DIR or pass --store-dir")
+        sys.exit(1)
+
+    summary = reparse_corpus(PageTextStore(args.store_dir), max(1, args.workers), args.diff_output, args.write)
+    logger.info(
+        f"Re-parsed {summary['papers']} papers in {summary['seconds']}s: {summary['changed']} changed, "
+        f"{summary['unchanged']} unchanged, {summary['errors']} errors "
+        f"({summary['questions_before']} -> {summary['questions_after']} questions)"
+    )
+    if summary['changed']:
+        logger.info(f"Changed questions written to {args.diff_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Retry and circuit-breaking for LLM requests.
+Transient failures (429, 5xx, connection errors) are retried with
+exponential backoff and full jitter, honouring any retry-after hint from the
+provider. A process-wide circuit breaker opens after repeated failures so
+callers wait for the API to recover instead of burning their retries, and
+every call can carry a deadline after which it gives up.
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting, timeouts and server-side errors
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Network failures raised without a status. The SDK's REST transport raises the
+# requests/urllib3 ones, which do not subclass the builtin ConnectionError.
+TRANSIENT_ERRORS: tuple = (ConnectionError, TimeoutError)
+try:
+    import requests
+    TRANSIENT_ERRORS += (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError
+    )
+except ImportError:
+    pass
+try:
+    import urllib3
+    TRANSIENT_ERRORS += (urllib3.exceptions.ProtocolError, urllib3.exceptions.TimeoutError)
+except ImportError:
+    pass
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit stays open past a caller's deadline."""
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a call cannot finish before its deadline."""
+
+
+def status_code(exc: BaseException) -> Optional[int]:
+    """Return the HTTP status carried by an API exception, if any."""
+    code = getattr(exc, 'code', None)
+    if isinstance(code, int):
+        return code
+    response = getattr(exc, 'response', None)
+    code = getattr(response, 'status_code', None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether a failed request may succeed if sent again."""
+    if isinstance(exc, TRANSIENT_ERRORS):
+        return True
+    return status_code(exc) in RETRYABLE_STATUS_CODES
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the provider asked us to wait, from the error itself, a Retry-After header or a RetryInfo detail."""
+    hint = getattr(exc, 'retry_after', None)
+    if isinstance(hint, (int, float)):
+        return max(0.0, float(hint))
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+    for detail in getattr(exc, 'details', None) or ():
+        delay = getattr(detail, 'retry_delay', None)
+        if delay is not None and hasattr(delay, 'seconds'):
+            return delay.seconds + getattr(delay, 'nanos', 0) / 1e9
+    return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, capped at max_delay."""
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int, hint: Optional[float] = None) -> float:
+        """Delay before retry number attempt (1-based); a retry-after hint is a lower bound."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if hint is not None:
+            delay = max(delay, min(hint, self.max_delay))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures. While open,
+    callers wait for reset_timeout; then a single probe request is let through
+    (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._cond = threading.Condition()
+
+    def acquire(self, deadline: Optional[float] = None) -> None:
+        """Block until a request may be sent. Raises CircuitOpenError if that is not before the deadline."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self.state == 'closed':
+                    return
+                if self.state == 'open':
+                    wait = self._opened_at + self.reset_timeout - now
+                    if wait <= 0:
+                        self.state = 'half_open'
+                        self._probing = False
+                        continue
+                elif not self._probing:
+                    self._probing = True
+                    return
+                else:
+                    # Another thread is probing; it notifies us when it finishes
+                    wait = self.reset_timeout
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0 or (self.state == 'open' and wait > remaining):
+                        raise CircuitOpenError("Gemini API circuit is open")
+                    wait = min(wait, remaining)
+                self._cond.wait(wait)
+
+    def record_success(self) -> None:
+        with self._cond:
+            if self.state != 'closed':
+                logger.info("Circuit closed, API calls resumed")
+            self.state = 'closed'
+            self.failures = 0
+            self._probing = False
+            self._cond.notify_all()
+
+    def record_failure(self) -> None:
+        with self._cond:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    logger.warning(f"Circuit opened after {self.failures} failures, pausing calls for {self.reset_timeout:.0f}s")
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+                self._probing = False
+                self._cond.notify_all()
+
+
+def call_with_retry(
+    fn: Callable[[], Any],
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker] = None,
+    deadline: Optional[float] = None,
+    on_retry: Optional[Callable[[int, float, BaseException], None]] = None
+) -> Any:
+    """
+    Call fn until it succeeds, a non-retryable error is raised, attempts run
+    out or the deadline (a time.monotonic() value) would be passed.
+    """
+    attempt = 0
+    while True:
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceededError(f"Deadline passed after {attempt} attempts")
+        if breaker is not None:
+            breaker.acquire(deadline)
+        attempt += 1
+        try:
+            result = fn()
+        except Exception as e:
+            if not is_retryable(e):
+                # The API answered, so it is healthy even though this request was rejected
+                if breaker is not None:
+                    breaker.record_success()
+                raise
+            if breaker is not None:
+                breaker.record_failure()
+            if attempt >= policy.max_attempts:
+                raise
+            delay = policy.backoff(attempt, retry_after(e))
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise DeadlineExceededError(f"Deadline would pass before retry {attempt}: {e}") from e
+            if on_retry is not None:
+                on_retry(attempt, delay, e)
+            time.sleep(delay)
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+_default_breaker: Optional[CircuitBreaker] = None
+_default_breaker_lock = threading.Lock()
+
+
+def get_default_breaker() -> CircuitBreaker:
+    """Return the circuit breaker shared by every client in this process."""
+    global _default_breaker
+    with _default_breaker_lock:
+        if _default_breaker is None:
+            _default_breaker = CircuitBreaker(
+                int(os.getenv('GEMINI_BREAKER_THRESHOLD', '5')),
+                float(os.getenv('GEMINI_BREAKER_RESET_SECONDS', '30'))
+            )
+        return _default_breaker
@@ -0,0 +1,62 @@
+"""
+Wall and CPU time accounting for the extraction pipeline.
+Stages are recorded by name, optionally against a page number, and can be
+forwarded to a callback as they complete for external metrics collection.
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Called as hook(stage, wall_seconds, cpu_seconds, page_number) for every recorded stage
+TimingHook = Callable[[str, float, float, Optional[int]], None]
+
+
+class StageTimer:
+    """
+    Collects per-stage and per-page timings for one extraction run.
+    Safe to record from several threads, e.g. the pooled OCR dispatch threads.
+    """
+
+    def __init__(self, hook: Optional[TimingHook] = None):
+        self.hook = hook
+        self.stages: Dict[str, Dict] = {}
+        self.pages: List[Dict] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str, page: Optional[int] = None) -> Iterator[None]:
+        """Time the enclosed block as one call of the named stage."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - wall_start, time.process_time() - cpu_start, page)
+
+    def record(self, name: str, wall: float, cpu: float, page: Optional[int] = None) -> None:
+        """Add a measurement taken elsewhere, e.g. inside an OCR worker process."""
+        with self._lock:
+            totals = self.stages.setdefault(name, {'wall_s': 0.0, 'cpu_s': 0.0, 'calls': 0})
+            totals['wall_s'] += wall
+            totals['cpu_s'] += cpu
+            totals['calls'] += 1
+            if page is not None:
+                self.pages.append({'page': page, 'stage': name, 'wall_s': wall, 'cpu_s': cpu})
+        if self.hook is not None:
+            self.hook(name, wall, cpu, page)
+
+    def summary(self) -> Dict:
+        """Return stage totals and per-page measurements, rounded for logging."""
+        with self._lock:
+            return {
+                'stages': {
+                    name: {'wall_s': round(t['wall_s'], 4), 'cpu_s': round(t['cpu_s'], 4), 'calls': t['calls']}
+                    for name, t in self.stages.items()
+                },
+                'pages': [
+                    {**entry, 'wall_s': round(entry['wall_s'], 4), 'cpu_s': round(entry['cpu_s'], 4)}
+                    for entry in self.pages
+                ]
+            }
@@ -5,9 +5,11 @@ Handles database operations for storing extracted questions
 
 import os
 import logging
-from typing import List, Dict, Optional
+import tempfile
+from typing import Iterable, List, Dict, Optional, Union
 from datetime import datetime
-import json
+
+from question_model import QuestionBatch
 
 try:
     from supabase import create_client, Client
@@ -28,7 +30,7 @@ class SupabaseQuestionManager:
         
         self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
         
-    def store_questions(self, questions: List[Dict], paper_metadata: Dict) -> bool:
+    def store_questions(self, questions: Union[QuestionBatch, Iterable[Dict]], paper_metadata: Dict) -> bool:
         """
         Store extracted questions in Supabase questions table
         """
@@ -41,38 +43,26 @@ class SupabaseQuestionManager:
             university = paper_metadata.get('university', '')
             paper_type = paper_metadata.get('paper_type', 'Regular')
             
-            # Prepare questions for insertion
-            question_records = []
-            
-            for question in questions:
-                # Map our question structure to database schema
-                record = {
-                    'semester': semester,
-                    'subject_code': subject_code,
-                    'subject_name': subject_name,
-                    'year': int(year) if str(year).isdigit() else datetime.now().year,
-                    'university': university,
-                    'paper_type': paper_type,
-                    'group_name': question.get('group', ''),
-                    'question_number': question.get('question_number', 1),
-                    'question_type': question.get('type', 'MCQ'),
-                    'question_text': question.get('text', ''),
-                    'options': json.dumps(question.get('options', [])) if question.get('options') else None,
-                    'correct_answer': question.get('correct_answer', ''),
-                    'explanation': question.get('explanation', ''),
-                    'difficulty_level': question.get('difficulty', 'Medium'),
-                    'marks': question.get('marks', 1),
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                }
-                question_records.append(record)
+            # Columns shared by every question of the paper are built once
+            now = datetime.now().isoformat()
+            paper_fields = {
+                'semester': semester,
+                'subject_code': subject_code,
+                'subject_name': subject_name,
+                'year': int(year) if str(year).isdigit() else datetime.now().year,
+                'university': university,
+                'paper_type': paper_type,
+                'created_at': now,
+                'updated_at': now
+            }
+            questions = QuestionBatch.coerce(questions)
             
-            # Insert questions in batches
+            # Insert questions in batches, mapping each batch to database rows only when it is sent
             batch_size = 50
             total_inserted = 0
             
-            for i in range(0, len(question_records), batch_size):
-                batch = question_records[i:i + batch_size]
+            for i in range(0, len(questions), batch_size):
+                batch = questions.to_records(paper_fields, i, i + batch_size)
                 
                 response = self.supabase.table('questions').insert(batch).execute()
                 
@@ -214,7 +204,7 @@ class EduPapersProcessor:
         """
         try:
             from pdf_extractor import PDFExtractor
-            from gemini_client import GeminiClient
+            from gemini_client import get_default_client
             
             # Extract filename if not provided
             if not filename:
@@ -239,7 +229,7 @@ class EduPapersProcessor:
             # Extract questions from PDF
             logger.info(f"Processing PDF: {filename}")
             extractor = PDFExtractor(pdf_path)
-            questions = extractor.extract_questions()
+            questions = extractor.extract_question_batch()
             
             if not questions:
                 return {
@@ -260,8 +250,14 @@ class EduPapersProcessor:
             
             # Optional: Generate AI answers (can be done asynchronously)
             try:
-                gemini_client = GeminiClient(pdf_path)
-                ai_results = gemini_client.process_questions(questions)
+                gemini_client = get_default_client()
+                # Uploads are answered in one go and never resumed, so the checkpoint is dropped with the call
+                with tempfile.TemporaryDirectory(prefix='edupapers-answers-') as checkpoint_dir:
+                    ai_results = gemini_client.process_questions(
+                        questions,
+                        checkpoint_path=os.path.join(checkpoint_dir, 'answers.jsonl'),
+                        pdf_path=pdf_path
+                    )
                 
                 # Update questions with AI answers
                 # This could be done in background for better performance
@@ -275,7 +271,10 @@ class EduPapersProcessor:
                 'message': f'Successfully processed {len(questions)} questions',
                 'questions_count': len(questions),
                 'metadata': metadata,
-                'questions': questions
+                'questions': questions,
+                'page_sources': extractor.get_page_sources(),
+                'section_markers': extractor.section_markers,
+                'timings': extractor.timings['stages']
             }
             
         except Exception as e:
@@ -0,0 +1,215 @@
+"""
+Token and cost accounting for answer generation.
+UsageLedger keeps process-wide usage per day, optionally appended to a
+JSONL log (one line per answered question) that also restores today's
+total after a restart. PaperAccount tracks one paper's answering run.
+Both enforce token budgets: callers reserve an estimate before a request
+and settle it with the real usage afterwards. A waiting reserve blocks while
+in-flight reservations are what stands in the way, and fails only once the
+usage already recorded leaves no room.
+"""
+
+import os
+import json
+import logging
+import threading
+from dataclasses import dataclass, asdict
+from datetime import date
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class UsageRecord:
+    """Tokens spent answering one question."""
+    day: str
+    paper: str
+    question: str
+    prompt_tokens: int
+    response_tokens: int
+    cost_usd: float
+
+
+class UsageLedger:
+    """
+    Token usage by day with an optional daily token budget (0 = unlimited).
+    Costs use per-million-token prices for prompt and response tokens.
+    """
+
+    def __init__(
+        self,
+        log_path: Optional[str] = None,
+        daily_token_budget: int = 0,
+        input_cost_per_mtok: float = 0.0,
+        output_cost_per_mtok: float = 0.0
+    ):
+        self.log_path = log_path
+        self.daily_token_budget = daily_token_budget
+        self.input_cost_per_mtok = input_cost_per_mtok
+        self.output_cost_per_mtok = output_cost_per_mtok
+        self._lock = threading.Lock()
+        # Notified whenever a reservation is returned, so waiting reserves re-check the budget
+        self._settled = threading.Condition(self._lock)
+        self._days: Dict[str, Dict] = {}
+        self._reserved = 0
+        if log_path:
+            os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+            self._load_today()
+
+    def cost(self, prompt_tokens: int, response_tokens: int) -> float:
+        return (prompt_tokens * self.input_cost_per_mtok + response_tokens * self.output_cost_per_mtok) / 1_000_000
+
+    def _day(self, day: str) -> Dict:
+        totals = self._days.get(day)
+        if totals is None:
+            totals = self._days[day] = {'questions': 0, 'prompt_tokens': 0, 'response_tokens': 0, 'cost_usd': 0.0}
+        return totals
+
+    def _add(self, record: UsageRecord) -> None:
+        totals = self._day(record.day)
+        totals['questions'] += 1
+        totals['prompt_tokens'] += record.prompt_tokens
+        totals['response_tokens'] += record.response_tokens
+        totals['cost_usd'] += record.cost_usd
+
+    def _load_today(self) -> None:
+        """Restore today's totals from the log so the daily budget survives restarts."""
+        if not os.path.exists(self.log_path):
+            return
+        today = date.today().isoformat()
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if today not in line:
+                    continue
+                try:
+                    record = UsageRecord(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+                if record.day == today:
+                    self._add(record)
+
+    def reserve(self, tokens: int, wait: bool = False) -> bool:
+        """
+        Set tokens aside for a request; False if that would exceed today's budget.
+        With wait, a request blocked only by other reservations waits for them to settle.
+        """
+        with self._settled:
+            while self.daily_token_budget:
+                totals = self._day(date.today().isoformat())
+                spent = totals['prompt_tokens'] + totals['response_tokens']
+                if spent + self._reserved + tokens <= self.daily_token_budget:
+                    break
+                if not wait or not self._reserved or spent + tokens > self.daily_token_budget:
+                    return False
+                self._settled.wait()
+            self._reserved += tokens
+            return True
+
+    def release(self, tokens: int) -> None:
+        with self._settled:
+            self._reserved = max(0, self._reserved - tokens)
+            self._settled.notify_all()
+
+    def record(self, record: UsageRecord) -> None:
+        with self._lock:
+            self._add(record)
+            if self.log_path:
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(asdict(record), ensure_ascii=False) + '\n')
+
+    def day_totals(self, day: Optional[str] = None) -> Dict:
+        """Usage of one day (today by default)."""
+        with self._lock:
+            return dict(self._day(day or date.today().isoformat()))
+
+
+class PaperAccount:
+    """Usage and optional token budget (0 = unlimited) of one paper, charged to a ledger."""
+
+    def __init__(self, paper: str, ledger: UsageLedger, token_budget: int = 0):
+        self.paper = paper
+        self.ledger = ledger
+        self.token_budget = token_budget
+        self.records: List[UsageRecord] = []
+        self.skipped = 0
+        self._reserved = 0
+        self._spent = 0
+        self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)
+
+    @property
+    def limited(self) -> bool:
+        return bool(self.token_budget or self.ledger.daily_token_budget)
+
+    def reserve(self, tokens: int, wait: bool = False) -> bool:
+        """
+        Reserve tokens against the paper budget and the daily budget. With wait,
+        blocks while in-flight requests hold the room it needs, and returns False
+        only once recorded usage alone leaves too little.
+        """
+        with self._settled:
+            while self.token_budget and self._spent + self._reserved + tokens > self.token_budget:
+                if not wait or not self._reserved or self._spent + tokens > self.token_budget:
+                    return False
+                self._settled.wait()
+            self._reserved += tokens
+        # The ledger may wait on other papers, so it is asked without holding this account's lock
+        if self.ledger.reserve(tokens, wait):
+            return True
+        with self._settled:
+            self._reserved -= tokens
+            self._settled.notify_all()
+        return False
+
+    def release(self, tokens: int) -> None:
+        """Return a reservation once the request has finished or failed."""
+        with self._settled:
+            self._reserved = max(0, self._reserved - tokens)
+            self._settled.notify_all()
+        self.ledger.release(tokens)
+
+    def record(self, question: str, prompt_tokens: int, response_tokens: int) -> None:
+        record = UsageRecord(
+            date.today().isoformat(), self.paper, question, prompt_tokens, response_tokens,
+            round(self.ledger.cost(prompt_tokens, response_tokens), 6)
+        )
+        with self._lock:
+            self._spent += prompt_tokens + response_tokens
+            self.records.append(record)
+        self.ledger.record(record)
+
+    def skip(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def summary(self) -> Dict:
+        with self._lock:
+            records = list(self.records)
+            skipped = self.skipped
+        return {
+            'paper': self.paper,
+            'questions': len({r.question for r in records}),
+            'skipped': skipped,
+            'prompt_tokens': sum(r.prompt_tokens for r in records),
+            'response_tokens': sum(r.response_tokens for r in records),
+            'cost_usd': round(sum(r.cost_usd for r in records), 6)
+        }
+
+
+_default_ledger: Optional[UsageLedger] = None
+_default_ledger_lock = threading.Lock()
+
+
+def get_default_ledger() -> UsageLedger:
+    """Return the process-wide ledger configured via USAGE_LOG_PATH and the GEMINI_* budget and price settings."""
+    global _default_ledger
+    with _default_ledger_lock:
+        if _default_ledger is None:
+            _default_ledger = UsageLedger(
+                os.getenv('USAGE_LOG_PATH') or None,
+                int(os.getenv('GEMINI_DAILY_TOKEN_BUDGET', '0')),
+                float(os.getenv('GEMINI_INPUT_COST_PER_MTOK', '0.075')),
+                float(os.getenv('GEMINI_OUTPUT_COST_PER_MTOK', '0.30'))
+            )
+        return _default_ledger